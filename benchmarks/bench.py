@@ -0,0 +1,268 @@
+"""
+Benchmarks the MOR compilation stages against synthetic site folders.
+
+Each stage (get_file_objects, each calculate_*, write_output_file and the save inside it)
+is timed and its peak Python memory allocation tracked. Results can be saved as JSON and
+compared against an earlier run to catch performance regressions:
+
+    python benchmarks/bench.py --rows 1000 100000 --json before.json
+    python benchmarks/bench.py --rows 1000 100000 --baseline before.json
+"""
+
+__version__ = "1.0.0"
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from fixtures import make_site
+
+import main  # noqa: E402  (fixtures puts compile-mor on the path)
+from classes import MOR  # noqa: E402
+from classes.xlclass.xlsx_class import Xlsx  # noqa: E402
+from config import get_configuration_data  # noqa: E402
+from modules import load_answers  # noqa: E402
+from utils import prompts_disabled  # noqa: E402
+
+FIXTURES_FOLDER = Path(tempfile.gettempdir()) / "compile-mor-benchmarks"
+"""Where the synthetic site folders are generated (and reused between runs)."""
+
+
+class StageTimer:
+    """
+    Records the wall time and peak memory allocated by each stage. Stages may be nested;
+    an outer stage's peak includes its inner stages.
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        """
+        Args:
+            trace_memory (bool, optional): If True, tracks peak memory with tracemalloc
+                (which slows the stages down). Defaults to True.
+        """
+        self.trace_memory = trace_memory
+        self.results = {}
+        self._peaks = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Times the code run in the context as the named stage.
+
+        Args:
+            name (str): The name of the stage.
+        """
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1][1] = max(self._peaks[-1][1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append([current, current])
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak_bytes = None
+            if self.trace_memory:
+                start_bytes, peak = self._peaks.pop()
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                peak_bytes = peak - start_bytes
+                if self._peaks:
+                    self._peaks[-1][1] = max(self._peaks[-1][1], peak)
+            self.results[name] = {"seconds": seconds, "peak_bytes": peak_bytes}
+
+    def timed(self, name: str, function):
+        """
+        Wraps a function so each call is timed as the named stage.
+
+        Args:
+            name (str): The name of the stage.
+            function (Callable): The function to wrap.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+def run_stages(site: Path, trace_memory: bool = True) -> dict:
+    """
+    Compiles the MOR for a site folder one stage at a time, without user prompts.
+
+    Args:
+        site (Path): The site folder generated by make_site.
+        trace_memory (bool, optional): If True, tracks peak memory. Defaults to True.
+
+    Returns:
+        dict: A dictionary of stage names and their seconds and peak_bytes.
+    """
+    CONFIG = get_configuration_data(app_files=site, working_folder=site)
+    answers = load_answers(site / "answers.json")
+    mor = MOR()
+    timer = StageTimer(trace_memory)
+
+    # MOR_Numbers.xlsx is reopened for writing inside write_out, so time the class method
+    save_values = Xlsx.save_values
+    Xlsx.save_values = timer.timed("save", save_values)
+    try:
+        with prompts_disabled():
+            with timer.stage("get_file_objects"):
+                files = main.load_files(CONFIG)
+
+            with timer.stage("calculate_mps_totals"):
+                main.calculate_mps(files, mor, answers)
+            with timer.stage("calculate_production_totals"):
+                main.calculate_production(files, mor, CONFIG, answers)
+            with timer.stage("calculate_mail_totals"):
+                main.calculate_mail(mor, answers)
+            # Includes waiting on the background PDF parse started by get_file_objects
+            with timer.stage("calculate_fleet_totals"):
+                main.calculate_fleet(files, mor, CONFIG, answers)
+            with timer.stage("write_output_file"):
+                main.write_out(files, main.compile_totals(mor), CONFIG)
+    finally:
+        Xlsx.save_values = save_values
+
+    return timer.results
+
+
+def benchmark(rows: int, repeat: int = 1, trace_memory: bool = True) -> dict:
+    """
+    Benchmarks the stages against a site with the given meter dump size. The fastest
+    time and the largest peak of the repeats are kept.
+
+    Args:
+        rows (int): The number of machine rows in the meter dump.
+        repeat (int, optional): The number of runs. Defaults to 1.
+        trace_memory (bool, optional): If True, tracks peak memory. Defaults to True.
+
+    Returns:
+        dict: A dictionary of stage names and their seconds and peak_bytes.
+    """
+    site = make_site(FIXTURES_FOLDER / f"{rows}_rows", rows)
+    best = {}
+    for _run in range(repeat):
+        make_site(site, rows)  # Fresh MOR_Numbers.xlsx copy
+        for name, result in run_stages(site, trace_memory).items():
+            if name not in best:
+                best[name] = result
+                continue
+            best[name]["seconds"] = min(best[name]["seconds"], result["seconds"])
+            if result["peak_bytes"] is not None:
+                best[name]["peak_bytes"] = max(
+                    best[name]["peak_bytes"], result["peak_bytes"]
+                )
+    return best
+
+
+def print_results(results: dict) -> None:
+    """
+    Prints a table of the results for each meter dump size.
+
+    Args:
+        results (dict): A dictionary of row counts and their stage results.
+    """
+    for rows, stages in results.items():
+        print(f"\n {rows} meter dump rows")
+        for name, result in stages.items():
+            peak = result["peak_bytes"]
+            memory = f"{peak / 2**20:9.1f} MiB" if peak is not None else ""
+            print(f"   {name:<30}{result['seconds']:9.3f}s{memory}")
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compares the results with a baseline run.
+
+    Args:
+        results (dict): A dictionary of row counts and their stage results.
+        baseline (dict): The results of an earlier run (loaded from its JSON file).
+        tolerance (float): The allowed slowdown or memory growth (0.25 = 25%).
+
+    Returns:
+        list[str]: A description of each stage that got slower or uses more memory.
+    """
+    regressions = []
+    for rows, stages in results.items():
+        for name, result in stages.items():
+            before = baseline.get(str(rows), {}).get(name)
+            if not before:
+                continue
+            for measure in ("seconds", "peak_bytes"):
+                if before[measure] and result[measure] is not None:
+                    change = result[measure] / before[measure] - 1
+                    if change > tolerance:
+                        regressions.append(
+                            f"{rows} rows {name} {measure}: {before[measure]:.3f}"
+                            f" -> {result[measure]:.3f} (+{change:.0%})"
+                        )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the MOR compilation stages."
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="meter dump sizes to benchmark (default: 1000 10000 100000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per size (default: 3)"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip peak memory tracking"
+    )
+    parser.add_argument("--json", type=Path, help="save the results to a JSON file")
+    parser.add_argument(
+        "--baseline", type=Path, help="JSON results to compare against"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown/memory growth against the baseline (default: 0.25)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    ARGS = parse_args()
+    if not ARGS.no_memory:
+        tracemalloc.start()
+
+    RESULTS = {}
+    for ROWS in ARGS.rows:
+        print(f"\n Benchmarking {ROWS} meter dump rows...")
+        RESULTS[ROWS] = benchmark(ROWS, ARGS.repeat, not ARGS.no_memory)
+    print_results(RESULTS)
+
+    if ARGS.json:
+        ARGS.json.write_text(json.dumps(RESULTS, indent=2), encoding="utf-8")
+
+    if ARGS.baseline:
+        BASELINE = json.loads(ARGS.baseline.read_text(encoding="utf-8"))
+        REGRESSIONS = find_regressions(RESULTS, BASELINE, ARGS.tolerance)
+        for REGRESSION in REGRESSIONS:
+            print(f" Regression: {REGRESSION}")
+        exit(1 if REGRESSIONS else 0)
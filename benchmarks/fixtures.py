@@ -0,0 +1,238 @@
+"""
+This module generates synthetic site folders for the benchmarks: a meter reads data dump,
+accuracy and timeliness matrices, a copy job report, an executive summary PDF, a copy of
+the MOR_Numbers.xlsx template and the config.json/answers.json files to run them headless.
+"""
+
+__version__ = "1.0.0"
+
+import calendar
+import json
+import random
+import shutil
+import sys
+from datetime import date
+from functools import partial
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "compile-mor"))
+
+from openpyxl import Workbook  # noqa: E402
+from openpyxl.utils import column_index_from_string  # noqa: E402
+
+from config.defaults import DEFAULTS  # noqa: E402
+
+MOR_TEMPLATE = REPO_ROOT / "output" / "MOR_Numbers.xlsx"
+"""The MOR_Numbers.xlsx template shipped with the program."""
+
+FLEET_TOTALS = (1234567, 89012)
+"""Black & white and color totals written to the executive summary PDF."""
+
+
+def _serial_number(row: int) -> str:
+    """Returns the synthetic serial number for a meter dump row."""
+    return f"SN{row:09d}"
+
+
+def make_meter_dump(filepath: Path, rows: int, production_info: dict) -> None:
+    """
+    Writes a meter reads data dump with a header row at row 4 and one machine per row.
+
+    Args:
+        filepath (Path): The path to save the workbook to.
+        rows (int): The number of machine rows.
+        production_info (dict): The production info; its meter columns are filled.
+    """
+    columns = production_info["meter columns"]
+    serial_col = column_index_from_string(columns["serials"])
+    bw_col = column_index_from_string(columns["total black and white"])
+    color_col = column_index_from_string(columns["total color"])
+    width = max(serial_col, bw_col, color_col)
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Meter Reads")
+    sheet.append(["Meter Reads Data Dump"])
+    sheet.append([f"Generated {date.today()}"])
+    sheet.append([])
+
+    header = [f"Column {index}" for index in range(1, width + 1)]
+    header[serial_col - 1] = "Serial Number"
+    header[bw_col - 1] = "Total Black and White"
+    header[color_col - 1] = "Total Color"
+    sheet.append(header)
+
+    rng = random.Random(rows)
+    for row in range(5, rows + 5):
+        values = [None] * width
+        values[0] = f"Site {row % 40}"
+        values[1] = rng.choice(("MP 6055", "MP C4504", "IM C3000", "Pro 8300"))
+        values[2] = date(2020, 1 + row % 12, 1 + row % 28)
+        values[serial_col - 1] = _serial_number(row)
+        values[bw_col - 1] = rng.randint(0, 2_000_000)
+        values[color_col - 1] = rng.randint(0, 500_000)
+        sheet.append(values)
+
+    workbook.save(filepath)
+
+
+def make_stats_matrix(filepath: Path, years: int = 5) -> None:
+    """
+    Writes an accuracy/timeliness report: years across the header row, months down
+    column A, ending with the current year.
+
+    Args:
+        filepath (Path): The path to save the workbook to.
+        years (int, optional): The number of year columns. Defaults to 5.
+    """
+    first_year = date.today().year - years + 1
+    rng = random.Random(str(filepath))
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Report")
+    sheet.append(["Monthly Management Report"])
+    # Year headers are stored as text like the exported reports ("2024.0")
+    sheet.append([None, *(f"{first_year + year}.0" for year in range(years))])
+    for month in range(1, 13):
+        sheet.append(
+            [
+                calendar.month_name[month],
+                *(round(rng.uniform(0.9, 1), 4) for _year in range(years)),
+            ]
+        )
+    workbook.save(filepath)
+
+
+def make_copy_jobs(filepath: Path, rows: int) -> None:
+    """
+    Writes a copy job counts report with one row per product type and the total at the end.
+
+    Args:
+        filepath (Path): The path to save the workbook to.
+        rows (int): The number of product type rows.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Report")
+    for line in range(1, 9):
+        sheet.append([f"Copy Job Counts by Product Type {line}"])
+    for row in range(rows):
+        sheet.append([f"Product Type {row}", row % 97])
+    sheet.append([f"Total Jobs: {sum(row % 97 for row in range(rows))}"])
+    workbook.save(filepath)
+
+
+def write_pdf(filepath: Path, pages: list[list[str]]) -> None:
+    """
+    Writes a minimal PDF with one line of Helvetica text per string.
+
+    Args:
+        filepath (Path): The path to save the PDF to.
+        pages (list[list[str]]): The lines of text on each page.
+    """
+    kids = " ".join(f"{4 + 2 * index} 0 R" for index in range(len(pages)))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for index, lines in enumerate(pages):
+        text = " ".join(f"({line}) Tj T*" for line in lines)
+        stream = f"BT /F1 12 Tf 72 720 Td 14 TL {text} ET"
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * index} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+
+    content = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(content))
+        content += f"{number} 0 obj\n{obj}\nendobj\n".encode()
+    xref = len(content)
+    content += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    content += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    content += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode()
+    content += f"startxref\n{xref}\n%%EOF\n".encode()
+    Path(filepath).write_bytes(bytes(content))
+
+
+def make_executive_summary(filepath: Path, pages: int = 3) -> None:
+    """
+    Writes an executive summary PDF with the fleet totals on the last page.
+
+    Args:
+        filepath (Path): The path to save the PDF to.
+        pages (int, optional): The number of pages. Defaults to 3.
+    """
+    bw_total, color_total = FLEET_TOTALS
+    filler = ["Executive Summary"]
+    filler += [f"Device group {line}: {line * 37} pages" for line in range(40)]
+    totals = ["Total pages", f"Grayscale: {bw_total:,}", f"Color: {color_total:,}"]
+    write_pdf(filepath, [*([filler] * (pages - 1)), totals])
+
+
+def make_production_info(rows: int) -> dict:
+    """
+    Returns production info pointing each machine at a meter dump row, spread from the
+    start to the end of the dump.
+
+    Args:
+        rows (int): The number of machine rows in the meter dump.
+
+    Returns:
+        dict: The production info for config.json.
+    """
+    production_info = json.loads(json.dumps(DEFAULTS["production info"]))
+    machines = [entry for entry in production_info if "machine" in entry]
+    for index, entry in enumerate(machines, 1):
+        row = 5 + (rows - 1) * index // len(machines)
+        production_info[entry]["serial number"] = _serial_number(row)
+    return production_info
+
+
+def make_site(folder: Path, rows: int) -> Path:
+    """
+    Writes a complete site folder: config.json, answers.json, MOR_Numbers.xlsx and the
+    data source files. Existing data source files are reused.
+
+    Args:
+        folder (Path): The site folder.
+        rows (int): The number of machine rows in the meter dump.
+
+    Returns:
+        Path: The site folder.
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    production_info = make_production_info(rows)
+
+    config = dict(DEFAULTS)
+    config.update(
+        {
+            "using default values": False,
+            "write log file": False,
+            "open output file": False,
+            "cache source files": False,
+            "production info": production_info,
+        }
+    )
+    (folder / "config.json").write_text(json.dumps(config, indent=2), encoding="utf-8")
+    shutil.copy(REPO_ROOT / "samples" / "answers.json", folder / "answers.json")
+    shutil.copy(MOR_TEMPLATE, folder / "MOR_Numbers.xlsx")
+
+    generators = {
+        "Meter_Reads_Data_Dump.xlsx": partial(
+            make_meter_dump, rows=rows, production_info=production_info
+        ),
+        "Monthly_Management_Accuracy.xlsx": make_stats_matrix,
+        "Monthly_Management_Timeliness.xlsx": make_stats_matrix,
+        "Copy_Job_Counts_by_Product_Type.xlsx": partial(
+            make_copy_jobs, rows=max(rows // 100, 10)
+        ),
+        "Executive summary.pdf": make_executive_summary,
+    }
+    for filename, generate in generators.items():
+        if not (folder / filename).is_file():
+            generate(folder / filename)
+    return folder
@@ -3,8 +3,16 @@ This package initializes the classes used in the Compile-MOR project.
 
 Modules:
     dclasses: Contains the MOR, ConfigData, and FileObj classes.
-    xlclass: Contains the Xlsx class.
+    xlclass: Contains the Xlsx class (imported on first use).
 """
 
 from .dclasses import MOR, ConfigData, FileObj
-from .xlclass import Xlsx
+
+
+def __getattr__(name):
+    """Import the Xlsx class on first use so Openpyxl isn't loaded at startup."""
+    if name == "Xlsx":
+        from .xlclass import Xlsx
+
+        return Xlsx
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from classes.xlclass import Xlsx
+if TYPE_CHECKING:
+    from classes.xlclass import Xlsx
+    from modules.sourcecache import SourceCache
 
 
 @dataclass
@@ -17,10 +23,21 @@ class ConfigData:
         open_output_file (bool): Flag to indicate if output file should be opened.
         bw_vol_regex (str): Regular expression for black and white volume.
         color_vol_regex (str): Regular expression for color volume.
+        pdf_max_pages (int): Number of executive summary pages to search for volumes.
+        pdf_bbox (list | None): Area (x0, top, x1, bottom) of each executive summary page to read.
         production_info (dict): Dictionary containing machine data.
         app_files (Path): Path to application files.
         working_folder (Path): Path to the working folder.
         default_values (bool): Flag to indicate if default values are being used.
+        parallel_loading (bool): Flag to indicate if input-only data source files should be read in worker processes.
+        cache_source_files (bool): Flag to indicate if values read from data sources should be cached.
+        cache_max_entries (int): Number of data source files to keep in the cache.
+        cache_max_age_days (int): Age in days after which cached values are removed.
+        trace_stages (bool): Flag to indicate if stage timings should be recorded.
+        record_history (bool): Flag to indicate if totals should be added to the history database.
+        log_format (str): Format of the log file, "jsonl" (JSON Lines) or "text".
+        log_max_bytes (int): Size in bytes at which the log file is rotated.
+        log_backups (int): Number of compressed log backups to keep.
     """
 
     today: date
@@ -29,10 +46,21 @@ class ConfigData:
     open_output_file: bool
     bw_vol_regex: str
     color_vol_regex: str
+    pdf_max_pages: int
+    pdf_bbox: list | None
     production_info: dict
     app_files: Path
     working_folder: Path
     default_values: bool
+    parallel_loading: bool
+    cache_source_files: bool
+    cache_max_entries: int
+    cache_max_age_days: int
+    trace_stages: bool
+    record_history: bool
+    log_format: str
+    log_max_bytes: int
+    log_backups: int
 
 
 @dataclass
@@ -48,6 +76,10 @@ class FileObj:
         mo_accuracy_x (Xlsx | None): Xlsx object for MO accuracy, or None.
         mo_timeliness_x (Xlsx | None): Xlsx object for MO timeliness, or None.
         log_file_p (Path): Path to the log file.
+        executive_summary_text (Future | None): Background text extraction of the
+            executive summary, or None if it wasn't started.
+        source_cache (SourceCache | None): Cache of values read from the data sources, or None.
+            Data sources with cached values may be CachedFile stand-ins instead of Xlsx objects.
     """
 
     mor_numbers_x: Xlsx
@@ -57,6 +89,8 @@ class FileObj:
     mo_accuracy_x: Xlsx | None
     mo_timeliness_x: Xlsx | None
     log_file_p: Path
+    executive_summary_text: Future | None = None
+    source_cache: SourceCache | None = None
 
 
 @dataclass
@@ -11,8 +11,15 @@ xls support Requirements:
 * xlrd==2.0.1
 """
 
-from .xlsx_class import Xlsx
-
 __version__ = '11.04.2021'
 
 __all__ = ['Xlsx']
+
+
+def __getattr__(name):
+    """Import the Xlsx class (and Openpyxl) on first use instead of at
+    package import, keeping program startup fast."""
+    if name == 'Xlsx':
+        from .xlsx_class import Xlsx
+        return Xlsx
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,97 @@
+from openpyxl.utils import get_column_letter
+
+
+class ArrayCell:
+    """Read-only cell returned by ArraySheet.iter_rows when values_only
+    isn't set."""
+
+    __slots__ = ('row', 'column', 'value')
+
+    def __init__(self, row: int, column: int, value: object) -> None:
+        self.row = row
+        self.column = column
+        self.value = value
+
+    @property
+    def coordinate(self) -> str:
+        return f'{get_column_letter(self.column)}{self.row}'
+
+
+class ArraySheet:
+    """Read-only, values-only worksheet backed by a list of row value
+    lists (ex: the values of a Pandas DataFrame). Supports the parts of
+    Openpyxl's read-only worksheet used by read-only Xlsx objects,
+    without creating a cell object for every value.
+    """
+
+    def __init__(self, rows: list, title: str = 'Sheet1') -> None:
+        """Wrap the passed row values.
+
+        Attrs:
+            *.title (str): Name of the sheet.
+            *.max_row (int): Number of rows.
+            *.max_column (int): Number of columns in the widest row.
+
+        Args:
+            rows (list(list)): Row value lists, first row first.
+            title (str, optional): Name of the sheet. Defaults to 'Sheet1'.
+        """
+        self.title = title
+        self._rows = rows
+        self.max_row = len(rows)
+        self.max_column = max((len(row) for row in rows), default=0)
+
+    def iter_rows(self, min_row: int = None, max_row: int = None,
+                  min_col: int = None, max_col: int = None,
+                  values_only: bool = False):
+        """Generator yielding a tuple of values (or ArrayCells) for each
+        row in the passed range, padded with None to the column range.
+
+        Args:
+            min_row (int, optional): First row number. Defaults to 1.
+            max_row (int, optional): Last row number. Defaults to max_row.
+            min_col (int, optional): First column number. Defaults to 1.
+            max_col (int, optional): Last column number. Defaults to
+                max_column.
+            values_only (bool, optional): Yield values instead of cells.
+                Defaults to False.
+
+        Yields:
+            tuple: Values (or ArrayCells) of the row.
+        """
+        min_row = min_row or 1
+        max_row = max_row or self.max_row
+        min_col = min_col or 1
+        max_col = max_col or self.max_column
+        width = max_col - min_col + 1
+
+        for row, values in enumerate(
+                self._rows[min_row - 1:max_row], min_row):
+            values = tuple(values[min_col - 1:max_col])
+            if len(values) < width:
+                values += (None,) * (width - len(values))
+            if values_only:
+                yield values
+            else:
+                yield tuple(ArrayCell(row, column, value) for column, value
+                            in enumerate(values, min_col))
+
+
+class ArrayWorkbook:
+    """Read-only workbook holding a single ArraySheet, so read-only Xlsx
+    objects can use it in place of an Openpyxl Workbook."""
+
+    def __init__(self, sheet: ArraySheet) -> None:
+        self.active = sheet
+        self.sheetnames = [sheet.title]
+
+    def __getitem__(self, name: str) -> ArraySheet:
+        if name != self.active.title:
+            raise KeyError(f'Worksheet {name} does not exist.')
+        return self.active
+
+    def save(self, filename: str) -> None:
+        raise TypeError('Workbook is read-only')
+
+    def close(self) -> None:
+        """Nothing to release; the values are already in memory."""
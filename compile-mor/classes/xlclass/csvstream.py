@@ -0,0 +1,281 @@
+import codecs
+import csv
+import re
+from datetime import datetime
+from itertools import chain, islice
+
+from openpyxl import Workbook
+
+from .arraysheet import ArrayCell
+
+# Bytes read to detect a file's encoding and delimiter
+SAMPLE_SIZE = 64 * 1024
+# Rows (after the header rows) read ahead to decide the column types
+SAMPLE_ROWS = 1000
+
+INT_RE = re.compile(r'-?(?:0|[1-9]\d*|[1-9]\d{0,2}(?:,\d{3})+)$')
+FLOAT_RE = re.compile(r'-?(?:0|[1-9]\d*|[1-9]\d{0,2}(?:,\d{3})+)?\.\d+$')
+DATE_RE = re.compile(r'\d{1,4}[-/]\d{1,2}[-/]\d{1,4}(?:[ T]\d|$)')
+DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S',
+                '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M', '%m/%d/%Y %H:%M:%S',
+                '%m/%d/%Y %H:%M', '%m/%d/%Y %I:%M:%S %p',
+                '%m/%d/%Y %I:%M %p')
+
+
+def detect_encoding(source_csv: str) -> str:
+    """Guess the encoding of a csv file from a sample of its start:
+    UTF-16/UTF-8 byte order marks, then UTF-8, falling back to
+    Windows-1252 (what Excel uses for "CSV" on Windows).
+
+    Args:
+        source_csv (str/pathlib.Path): Path to the csv file.
+
+    Returns:
+        str: Encoding name. ex: 'utf-8-sig'
+    """
+    with open(source_csv, 'rb') as f:
+        sample = f.read(SAMPLE_SIZE)
+
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        # Not final, so a character cut off by the sample end is fine
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return 'cp1252'
+    return 'utf-8-sig'
+
+
+def infer_value(text: str) -> object:
+    """Convert csv text to an int, float or datetime if it looks like
+    one. Numbers with leading zeros (ex: serial numbers) stay text.
+
+    Args:
+        text (str): Value read from the csv file.
+
+    Returns:
+        object: Converted value, the text, or None if it's empty.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    if INT_RE.match(text):
+        return int(text.replace(',', ''))
+    if FLOAT_RE.match(text):
+        return float(text.replace(',', ''))
+    if DATE_RE.match(text):
+        for date_format in DATE_FORMATS:
+            try:
+                return datetime.strptime(text, date_format)
+            except ValueError:
+                pass
+    return text
+
+
+def _sniff_delimiter(sample: str) -> str:
+    """Return the delimiter (',', ';', tab or '|') used in a sample of
+    csv text, or ',' if it can't be detected."""
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+    except csv.Error:
+        return ','
+
+
+def detect_delimiter(source_csv: str, encoding: str) -> str:
+    """Return the delimiter used in a csv file, detected from a sample
+    of its start (',' if it can't be detected).
+
+    Args:
+        source_csv (str/pathlib.Path): Path to the csv file.
+        encoding (str): Encoding of the file.
+
+    Returns:
+        str: The delimiter. ex: ';'
+    """
+    with open(source_csv, 'r', encoding=encoding, errors='replace',
+              newline='') as f:
+        return _sniff_delimiter(f.read(SAMPLE_SIZE))
+
+
+def text_columns(rows: list) -> set:
+    """Return the columns of the sampled rows that have to be kept as
+    text: columns holding text after a number or date, or a number that
+    has to stay text (ex: '00123'). Text labels above a column's first
+    number (titles and headers of report exports) don't make it text.
+
+    Args:
+        rows (list(list(str))): Sampled rows of csv text.
+
+    Returns:
+        set(int): Indexes of the text columns.
+    """
+    typed, text = set(), set()
+    for row in rows:
+        for column, value in enumerate(row):
+            if column in text:
+                continue
+            value = infer_value(value)
+            if not isinstance(value, str):
+                typed.add(column)
+            elif column in typed or value[0].isdigit():
+                text.add(column)
+
+    return text
+
+
+def read_csv(source_csv: str, encoding: str = None, delimiter: str = None,
+             infer_types: bool = True, header_rows: int = 1):
+    """Generator yielding the rows of a csv file one at a time, so
+    large files are read in bounded memory. Values are converted to
+    numbers and dates column by column. The type of each column is
+    decided from the first SAMPLE_ROWS rows after the header rows
+    (see text_columns) before any row is yielded, so a text column
+    (ex: serial numbers) within the sample is never partly converted.
+    Past the sample, values of number/date columns that don't convert
+    are kept as text.
+
+    Args:
+        source_csv (str/pathlib.Path): Path to the csv file.
+        encoding (str, optional): Encoding of the file. Detected from
+            the file if not passed. Defaults to None.
+        delimiter (str, optional): Value delimiter. Detected from the
+            file (',' if it can't be) if not passed. Defaults to None.
+        infer_types (bool, optional): Convert numbers and dates. Values
+            are kept as text (empty values as None) if False. Defaults
+            to True.
+        header_rows (int, optional): Number of rows at the start of
+            the file kept as text. Defaults to 1.
+
+    Yields:
+        list: Values of the row.
+    """
+    encoding = encoding or detect_encoding(source_csv)
+
+    with open(source_csv, 'r', encoding=encoding, errors='replace',
+              newline='') as f:
+        if not delimiter:
+            delimiter = _sniff_delimiter(f.read(SAMPLE_SIZE))
+            f.seek(0)
+
+        reader = csv.reader(f, delimiter=delimiter)
+        for row in islice(reader, header_rows if infer_types else None):
+            yield [value or None for value in row]
+
+        # Decide the column types before yielding the sampled rows
+        sampled = list(islice(reader, SAMPLE_ROWS))
+        text = text_columns(sampled)
+
+        for row in chain(sampled, reader):
+            yield [(value or None) if column in text else infer_value(value)
+                   for column, value in enumerate(row)]
+
+
+def csv_to_xlsx(source_csv: str, savepath: str, sheetname: str = 'Sheet1',
+                **options) -> int:
+    """Convert a csv file to an *.xlsx file through Openpyxl's write-only
+    mode, so neither file is ever fully held in memory.
+
+    Args:
+        source_csv (str/pathlib.Path): Path to the csv file.
+        savepath (str/pathlib.Path): Output *.xlsx file location.
+        sheetname (str, optional): Name of the sheet. Defaults to
+            'Sheet1'.
+        **options: read_csv options (encoding, delimiter, infer_types,
+            header_rows).
+
+    Returns:
+        int: Number of rows written.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheetname)
+    rows = 0
+    for row in read_csv(source_csv, **options):
+        ws.append(row)
+        rows += 1
+    wb.save(savepath)
+
+    return rows
+
+
+class CsvSheet:
+    """Read-only, values-only worksheet streamed from a csv file. Each
+    pass over the rows reads the file again through read_csv, so only
+    the values a caller keeps (ex: the columns a Table loads) are held
+    in memory. Supports the same parts of Openpyxl's read-only worksheet
+    as ArraySheet.
+    """
+
+    def __init__(self, source_csv: str, title: str = 'Sheet1',
+                 **options) -> None:
+        """Detect the file's encoding and delimiter once. No rows are
+        read until they're needed.
+
+        Attrs:
+            *.title (str): Name of the sheet.
+            *.max_row (int): Number of rows (counted on first use).
+            *.max_column (int): Number of columns in the widest row
+            (counted on first use).
+
+        Args:
+            source_csv (str/pathlib.Path): Path to the csv file.
+            title (str, optional): Name of the sheet. Defaults to
+                'Sheet1'.
+            **options: read_csv options (encoding, delimiter,
+                infer_types, header_rows).
+        """
+        self.title = title
+        self._source = source_csv
+        encoding = options.get('encoding') or detect_encoding(source_csv)
+        options['encoding'] = encoding
+        options['delimiter'] = (options.get('delimiter')
+                                or detect_delimiter(source_csv, encoding))
+        self._options = options
+        self._size = None
+
+    def _count(self) -> tuple:
+        """Return the number of rows and columns, counted in one pass."""
+        if self._size is None:
+            rows = columns = 0
+            with open(self._source, 'r', encoding=self._options['encoding'],
+                      errors='replace', newline='') as f:
+                for row in csv.reader(f, delimiter=self._options['delimiter']):
+                    rows += 1
+                    columns = max(columns, len(row))
+            self._size = (rows, columns)
+
+        return self._size
+
+    @property
+    def max_row(self) -> int:
+        return self._count()[0]
+
+    @property
+    def max_column(self) -> int:
+        return self._count()[1]
+
+    def iter_rows(self, min_row: int = None, max_row: int = None,
+                  min_col: int = None, max_col: int = None,
+                  values_only: bool = False):
+        """Generator yielding a tuple of values (or ArrayCells) for each
+        row in the passed range, padded with None to the column range.
+        See ArraySheet.iter_rows for the arguments.
+
+        Yields:
+            tuple: Values (or ArrayCells) of the row.
+        """
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_col = max_col or self.max_column
+        width = max_col - min_col + 1
+        rows = islice(read_csv(self._source, **self._options),
+                      min_row - 1, max_row)
+
+        for row, values in enumerate(rows, min_row):
+            values = tuple(values[min_col - 1:max_col])
+            if len(values) < width:
+                values += (None,) * (width - len(values))
+            if values_only:
+                yield values
+            else:
+                yield tuple(ArrayCell(row, column, value) for column, value
+                            in enumerate(values, min_col))
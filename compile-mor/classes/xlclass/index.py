@@ -0,0 +1,133 @@
+from bisect import bisect_left
+
+# Supported match modes for ColumnIndex.find
+MATCH_MODES = ('exact', 'prefix', 'substring')
+
+
+class ColumnIndex:
+    """Lookup index for the values of a single worksheet column. Built
+    once from a {row: value} dictionary and used to find matching rows
+    without rereading (or str() converting) every cell on each lookup.
+    """
+
+    def __init__(self, values: dict) -> None:
+        """Generate the index from the passed cell values.
+
+        Attrs:
+            *.values (dict): Dictionary of row numbers and cell values for
+            every populated cell in the column. {5: 'E1234'}
+
+        Args:
+            values (dict): Dictionary of row numbers and cell values.
+        """
+        self.values = values
+        self._rows = {}
+        self._keys = None
+
+        # Group row numbers by str value (empty cells are never matched)
+        for row, value in values.items():
+            if value:
+                self._rows.setdefault(str(value), []).append(row)
+
+    def find(self, srchval: str, match: str = 'substring',
+             startrow: int = 1, ignore_case: bool = False) -> list:
+        """Find the rows with values matching the search value.
+
+        Args:
+            srchval (str): Value to search for. ex: 'Total'
+            match (str, optional): 'exact' (whole value), 'prefix'
+                (value starts with srchval) or 'substring' (value
+                contains srchval). Defaults to 'substring'.
+            startrow (int, optional): First row number to include.
+                Defaults to 1.
+            ignore_case (bool, optional): Compare lowercased values
+                ('substring' only). Defaults to False.
+
+        Returns:
+            list: Sorted list of matching row numbers.
+        """
+        if match == 'exact':
+            rows = self._rows.get(srchval, [])
+
+        elif match == 'prefix':
+            # Build sorted keys on first use and bisect to the prefix run
+            if self._keys is None:
+                self._keys = sorted(self._rows)
+            rows = []
+            for key in self._keys[bisect_left(self._keys, srchval):]:
+                if not key.startswith(srchval):
+                    break
+                rows.extend(self._rows[key])
+
+        elif match == 'substring':
+            if ignore_case:
+                srchval = srchval.lower()
+            rows = [row for key, key_rows in self._rows.items()
+                    if srchval in (key.lower() if ignore_case else key)
+                    for row in key_rows]
+
+        else:
+            raise ValueError(
+                f"Invalid match mode '{match}'. Use one of {MATCH_MODES}.")
+
+        return sorted(row for row in rows if row >= startrow)
+
+
+def normalize_label(value: object) -> str:
+    """Return the str form of a header/row label used for exact
+    matching. Whole numbers are written without decimals so 2024,
+    2024.0 and '2024.0' all match '2024'. Text is stripped.
+
+    Args:
+        value (object): Cell value or search value.
+
+    Returns:
+        str: Normalized label. Empty string for empty cells.
+    """
+    if value is None or isinstance(value, bool):
+        return '' if value is None else str(value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    label = str(value).strip()
+    whole, _dot, decimals = label.partition('.')
+    if decimals and not decimals.strip('0') and whole.lstrip('-').isdigit():
+        return whole
+    return label
+
+
+class LabelIndex:
+    """Header/row label index for a whole sheet. Built once from the
+    sheet's rows, it maps each (normalized) value to the column and row
+    of its first occurrence so the intersection of a header and a row
+    label can be looked up without rescanning the sheet.
+    """
+
+    def __init__(self, rows) -> None:
+        """Generate the index from the passed rows of cell values.
+
+        Args:
+            rows (iterable(tuple(int, tuple))): Row numbers and the cell
+                values of each row. ex: Table.rows()
+        """
+        self._positions = {}
+
+        for row, values in rows:
+            for column, value in enumerate(values, 1):
+                if value is not None:
+                    self._positions.setdefault(
+                        normalize_label(value), (row, column))
+
+    def column(self, header: object) -> int:
+        """Return the column number of the first cell matching the
+        header exactly (after normalizing), or None if not found."""
+        position = self._positions.get(normalize_label(header))
+        return position[1] if position else None
+
+    def row(self, label: object) -> int:
+        """Return the row number of the first cell matching the row
+        label exactly (after normalizing), or None if not found."""
+        position = self._positions.get(normalize_label(label))
+        return position[0] if position else None
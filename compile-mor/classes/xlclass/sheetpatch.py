@@ -0,0 +1,266 @@
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+import zipfile
+from datetime import date, datetime, time
+from pathlib import Path
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from openpyxl.utils import coordinate_to_tuple
+from openpyxl.utils.datetime import to_excel
+
+NAMESPACES = {
+    'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+    'r': ('http://schemas.openxmlformats.org/officeDocument/2006/'
+          'relationships'),
+}
+
+ROW_RE = re.compile(r'<row\b([^>]*?)(?:/>|>(.*?)</row>)', re.DOTALL)
+CELL_RE = re.compile(r'<c\b([^>]*?)(?:/>|>.*?</c>)', re.DOTALL)
+REF_RE = re.compile(r'\br="([^"]*)"')
+STYLE_RE = re.compile(r'\ss="\d+"')
+FORMULA_RE = re.compile(r'<f[\s>/]')
+CALC_RE = re.compile(r'<calcPr\b([^>]*?)(?:/>|>.*?</calcPr>)',
+                     re.DOTALL)
+
+
+def sheet_names(filepath: str) -> list:
+    """Return the worksheet names of an *.xlsx file from its workbook
+    part, without loading the workbook (or its shared strings).
+
+    Args:
+        filepath (str/pathlib.Path): *.xlsx file.
+
+    Returns:
+        list(str): Sheet names in workbook order.
+    """
+    with zipfile.ZipFile(filepath) as archive:
+        workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+
+    return [sheet.get('name') for sheet in
+            workbook.iterfind('main:sheets/main:sheet', NAMESPACES)]
+
+
+def _sheet_part(archive: zipfile.ZipFile, sheetname: str) -> str:
+    """Return the zip member name of a worksheet's XML part.
+
+    Args:
+        archive (zipfile.ZipFile): Open *.xlsx file.
+        sheetname (str): Name of the worksheet. ex: 'Data Entry'
+
+    Raises:
+        KeyError: If the workbook has no sheet with that name.
+
+    Returns:
+        str: Member name. ex: 'xl/worksheets/sheet1.xml'
+    """
+    workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+    for sheet in workbook.iterfind('main:sheets/main:sheet', NAMESPACES):
+        if sheet.get('name') == sheetname:
+            rel_id = sheet.get(f"{{{NAMESPACES['r']}}}id")
+            break
+    else:
+        raise KeyError(f'Worksheet {sheetname} does not exist.')
+
+    rels = ElementTree.fromstring(
+        archive.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels.iterfind('rel:Relationship', NAMESPACES):
+        if rel.get('Id') == rel_id:
+            target = rel.get('Target')
+            if target.startswith('/'):
+                return target[1:]
+            return posixpath.normpath(posixpath.join('xl', target))
+    raise KeyError(f'Worksheet {sheetname} has no XML part.')
+
+
+def _cell_xml(coordinate: str, value: object, style: str = '') -> str:
+    """Return the XML of a cell holding the passed value. Strings are
+    written inline so the shared strings part isn't changed.
+
+    Args:
+        coordinate (str): Cell address. ex: 'B5'
+        value (object): Cell value. Strings starting with '=' are
+            written as formulas.
+        style (str, optional): Style attribute kept from the existing
+            cell. ex: ' s="3"' Defaults to ''.
+
+    Returns:
+        str: The cell's XML.
+    """
+    if value is None:
+        return f'<c r="{coordinate}"{style}/>'
+    if isinstance(value, bool):
+        return f'<c r="{coordinate}"{style} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{coordinate}"{style}><v>{value!r}</v></c>'
+    if isinstance(value, (datetime, date, time)):
+        return f'<c r="{coordinate}"{style}><v>{to_excel(value)!r}</v></c>'
+
+    value = str(value)
+    if value.startswith('=') and len(value) > 1:
+        return f'<c r="{coordinate}"{style}><f>{escape(value[1:])}</f></c>'
+    return (f'<c r="{coordinate}"{style} t="inlineStr"><is>'
+            f'<t xml:space="preserve">{escape(value)}</t></is></c>')
+
+
+def _patch_row(attrs: str, body: str, row: int, cells: dict) -> str:
+    """Return the XML of a row with the passed cells replaced (or
+    inserted in column order). Styles of replaced cells are kept.
+
+    Args:
+        attrs (str): Attributes of the row element.
+        body (str): Cell XML of the row.
+        row (int): Row number.
+        cells (dict{int: tuple(str, object)}): Column numbers and the
+            cell address and value to set.
+
+    Raises:
+        ValueError: If the row holds XML that isn't a list of
+            addressed cells, or a formula cell would be overwritten
+            with a value (it would stay listed in the calcChain part).
+
+    Returns:
+        str: The row's XML.
+    """
+    existing = {}
+    for match in CELL_RE.finditer(body):
+        ref = REF_RE.search(match.group(1))
+        if not ref:
+            raise ValueError(f'Cell without address in row {row}.')
+        existing[coordinate_to_tuple(ref.group(1))[1]] = match
+    if CELL_RE.sub('', body).strip():
+        raise ValueError(f'Unexpected XML in row {row}.')
+
+    merged = {column: match.group(0) for column, match in existing.items()}
+    for column, (coordinate, value) in cells.items():
+        style = ''
+        if column in existing:
+            if (FORMULA_RE.search(existing[column].group(0))
+                    and not str(value).startswith('=')):
+                raise ValueError(f'Cell {coordinate} holds a formula.')
+            style = STYLE_RE.search(existing[column].group(1))
+            style = style.group(0) if style else ''
+        merged[column] = _cell_xml(coordinate, value, style)
+
+    return (f'<row{attrs}>'
+            + ''.join(merged[column] for column in sorted(merged))
+            + '</row>')
+
+
+def patch_sheet_xml(xml: str, values: dict) -> str:
+    """Return the worksheet XML with the passed cell values set. Only
+    the rows holding those cells are rewritten; everything else is
+    copied as is.
+
+    Args:
+        xml (str): Worksheet XML.
+        values (dict{str: object}): Cell addresses and values.
+            ex: {'B5': 100}
+
+    Raises:
+        ValueError: If the sheet XML can't be patched safely (prefixed
+            elements, rows or cells without addresses, formula cells
+            overwritten with values).
+
+    Returns:
+        str: The patched worksheet XML.
+    """
+    if '<sheetData' not in xml:
+        raise ValueError('Worksheet has no sheetData element.')
+
+    by_row = {}
+    for coordinate, value in values.items():
+        row, column = coordinate_to_tuple(coordinate.upper())
+        by_row.setdefault(row, {})[column] = (coordinate.upper(), value)
+
+    def replace_row(match):
+        ref = REF_RE.search(match.group(1))
+        if not ref:
+            raise ValueError('Row without a row number.')
+        row = int(ref.group(1))
+        if row not in by_row:
+            return match.group(0)
+        return _patch_row(match.group(1).rstrip(), match.group(2) or '',
+                          row, by_row.pop(row))
+
+    xml = ROW_RE.sub(replace_row, xml)
+
+    # Insert rows that didn't exist before the first row after them
+    xml = re.sub(r'<sheetData\s*/>', '<sheetData></sheetData>', xml)
+    for row, cells in sorted(by_row.items()):
+        new_row = _patch_row(f' r="{row}"', '', row, cells)
+        position = xml.index('</sheetData>')
+        for match in ROW_RE.finditer(xml):
+            if int(REF_RE.search(match.group(1)).group(1)) > row:
+                position = match.start()
+                break
+        xml = xml[:position] + new_row + xml[position:]
+
+    return xml
+
+
+def _full_calc_on_load(xml: str) -> str:
+    """Return the workbook XML with formulas set to recalculate when the
+    file is opened (so formulas using patched cells aren't stale)."""
+
+    def replace(match):
+        attrs = re.sub(r'\sfullCalcOnLoad="[^"]*"', '', match.group(1))
+        return f'<calcPr{attrs.rstrip()} fullCalcOnLoad="1"/>'
+
+    return CALC_RE.sub(replace, xml, count=1)
+
+
+def patch_sheet_values(filepath: str, sheetname: str, values: dict,
+                       savepath: str = None) -> None:
+    """Set cell values in one worksheet of an *.xlsx file by rewriting
+    only that sheet's XML part (and the workbook's recalculation flag).
+    Every other part of the file is copied unchanged, so the time taken
+    doesn't grow with the rest of the workbook and features Openpyxl
+    doesn't support are kept.
+
+    Args:
+        filepath (str/pathlib.Path): *.xlsx file to patch.
+        sheetname (str): Name of the worksheet. ex: 'Data Entry'
+        values (dict{str: object}): Cell addresses and values.
+            ex: {'B5': 100}
+        savepath (str/pathlib.Path, optional): Output file location.
+            Overwrites filepath if not specified. Defaults to None.
+
+    Raises:
+        KeyError: If the workbook has no sheet with that name.
+        ValueError: If the sheet XML can't be patched safely.
+    """
+    savepath = Path(savepath or filepath)
+
+    with zipfile.ZipFile(filepath) as source:
+        part = _sheet_part(source, sheetname)
+        patched = {
+            part: patch_sheet_xml(
+                source.read(part).decode('utf-8'), values).encode('utf-8'),
+            'xl/workbook.xml': _full_calc_on_load(
+                source.read('xl/workbook.xml').decode('utf-8')
+            ).encode('utf-8'),
+        }
+
+        # Write next to the target and swap it in once complete
+        handle, temp_path = tempfile.mkstemp(
+            suffix='.xlsx', dir=savepath.parent)
+        os.close(handle)
+        try:
+            # Keep the permissions of the file being replaced
+            shutil.copymode(savepath if savepath.exists() else filepath,
+                            temp_path)
+            with zipfile.ZipFile(temp_path, 'w') as target:
+                for info in source.infolist():
+                    data = patched.get(info.filename)
+                    if data is None:
+                        data = source.read(info)
+                    target.writestr(info, data)
+            os.replace(temp_path, savepath)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
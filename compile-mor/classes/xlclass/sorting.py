@@ -0,0 +1,70 @@
+from datetime import date, datetime, time
+
+# Sort order of the value kinds: numbers, then dates, then text, then
+# empty cells
+NUMBER, DATE, TEXT, EMPTY = range(4)
+
+
+def sort_key(value: object) -> tuple:
+    """Return a sort key for a cell value that orders numbers (including
+    numeric text such as '1,200') by value, dates and times by date, and
+    other text case-insensitively. Empty cells sort last.
+
+    Args:
+        value (object): Cell value.
+
+    Returns:
+        tuple: Kind of value and the value to compare. ex: (0, 1200.0)
+    """
+    if value is None:
+        return (EMPTY, 0)
+    if isinstance(value, (int, float)):
+        return (NUMBER, value)
+    if isinstance(value, datetime):
+        return (DATE, value)
+    if isinstance(value, date):
+        return (DATE, datetime.combine(value, time()))
+    if isinstance(value, time):
+        return (DATE, datetime.combine(date.min, value))
+
+    text = str(value).strip()
+    if not text:
+        return (EMPTY, 0)
+    try:
+        return (NUMBER, float(text.replace(',', '')))
+    except ValueError:
+        return (TEXT, text.lower())
+
+
+def sort_rows(rows: list, positions: list, reverse: bool = False) -> list:
+    """Sort row value tuples by the values at the passed positions. Each
+    row's key is worked out once, and rows with equal keys keep their
+    original order. Descending sorts only reverse the values within each
+    kind, so numbers still come before dates and text, and empty cells
+    still sort last.
+
+    Args:
+        rows (list(tuple)): Row values.
+        positions (list(int)): Indexes of the values to sort by, most
+            significant first. ex: [0, 2]
+        reverse (bool, optional): Sort in descending order. Defaults to
+            False.
+
+    Returns:
+        list(tuple): The sorted rows.
+    """
+    def row_key(values):
+        return tuple(sort_key(values[position] if position < len(values)
+                              else None) for position in positions)
+
+    if not reverse:
+        return sorted(rows, key=row_key)
+
+    # Stable sorts from the least significant position: values
+    # descending, then regrouped by kind in ascending order
+    keyed = [(row_key(values), values) for values in rows]
+    for number in reversed(range(len(positions))):
+        keyed.sort(key=lambda item: item[0][number], reverse=True)
+        keyed.sort(key=lambda item: item[0][number][0])
+
+    return [values for _, values in keyed]
@@ -0,0 +1,147 @@
+from copy import copy
+
+from openpyxl.styles import Border, Font, Side
+from openpyxl.utils import column_index_from_string
+
+# Shared style objects used by the Xlsx formatting methods
+BOLD = Font(bold=True)
+THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
+                     top=Side(style='thin'), bottom=Side(style='thin'))
+CURRENCY = '$#,###.00'
+
+
+class StyleBatch:
+    """Collects formatting operations over row/column ranges of a
+    worksheet and applies them all in a single pass over its cells.
+    Each distinct combination of a cell's existing style and the
+    operations applied to it is only resolved once; every other cell
+    with the same combination shares the resulting style, so no style
+    objects are created or looked up per cell.
+    """
+
+    def __init__(self, ws: object) -> None:
+        """Start an empty batch for the passed worksheet.
+
+        Args:
+            ws (openpyxl.Workbook.worksheet): Worksheet to format.
+        """
+        self.ws = ws
+        self._operations = []
+
+    def add(self, attr: str, style: object, startrow: int = 1,
+            stoprow: int = 0, col: str = None, step: int = 1,
+            when: object = None) -> object:
+        """Add a formatting operation to the batch. Operations are
+        applied in the order they were added, so later operations on
+        the same attribute override earlier ones.
+
+        Args:
+            attr (str): Cell style attribute to set. 'font', 'fill',
+                'border', 'alignment' or 'number_format'.
+            style (object): Style object (or number format) to set.
+            startrow (int, optional): First row to format. Defaults to 1.
+            stoprow (int, optional): Row number (not included) where
+                formatting stops. Formats every remaining row if not
+                passed. Defaults to 0.
+            col (str, optional): Only format this column. Formats every
+                column if not passed. Defaults to None.
+            step (int, optional): Format every nth row from startrow
+                (2 for alternating rows). Defaults to 1.
+            when (Callable, optional): Only format cells whose value
+                this function returns True for. Defaults to None.
+
+        Returns:
+            self: StyleBatch object.
+        """
+        column = column_index_from_string(col.upper()) if col else None
+        self._operations.append(
+            (attr, style, startrow, stoprow, column, step, when))
+
+        return self
+
+    def font(self, font: Font, **kwargs) -> object:
+        """Add a font operation. See *.add() for the range arguments."""
+        return self.add('font', font, **kwargs)
+
+    def fill(self, fill: object, **kwargs) -> object:
+        """Add a background fill operation. See *.add() for the range
+        arguments."""
+        return self.add('fill', fill, **kwargs)
+
+    def border(self, border: Border = THIN_BORDER, **kwargs) -> object:
+        """Add a border operation (thin borders on every side by
+        default). See *.add() for the range arguments."""
+        return self.add('border', border, **kwargs)
+
+    def number_format(self, number_format: str, **kwargs) -> object:
+        """Add a number format operation. See *.add() for the range
+        arguments."""
+        return self.add('number_format', number_format, **kwargs)
+
+    def _bounds(self) -> tuple:
+        """Return the first and last row and column any operation
+        formats, within the sheet's populated rows and columns (None
+        for the columns if every column is formatted)."""
+        operations = self._operations
+        first_row = min(operation[2] for operation in operations)
+        last_row = self.ws.max_row
+        if all(operation[3] for operation in operations):
+            last_row = min(last_row, max(
+                operation[3] for operation in operations) - 1)
+        columns = [operation[4] for operation in operations]
+        if None in columns:
+            return first_row, last_row, None, None
+        return (first_row, last_row, min(columns),
+                min(max(columns), self.ws.max_column))
+
+    def apply(self) -> int:
+        """Apply every operation in the batch in a single pass over the
+        worksheet's cells, then clear the batch.
+
+        Returns:
+            int: Number of cells formatted.
+        """
+        if not self._operations:
+            return 0
+
+        first_row, last_row, min_col, max_col = self._bounds()
+        resolved = {}
+        formatted = 0
+        if first_row > last_row or (min_col and min_col > max_col):
+            self._operations.clear()
+            return formatted
+
+        for row_number, row in enumerate(self.ws.iter_rows(
+                min_row=first_row, max_row=last_row, min_col=min_col,
+                max_col=max_col), first_row):
+            active = [
+                (number, operation)
+                for number, operation in enumerate(self._operations)
+                if row_number >= operation[2]
+                and (not operation[3] or row_number < operation[3])
+                and (row_number - operation[2]) % operation[5] == 0]
+            if not active:
+                continue
+
+            for cell in row:
+                applied = tuple(
+                    number for number, operation in active
+                    if (operation[4] is None or cell.column == operation[4])
+                    and (operation[6] is None or operation[6](cell.value)))
+                if not applied:
+                    continue
+
+                # Resolve each style combination once, then share it
+                key = (cell.has_style and tuple(cell._style), applied)
+                style = resolved.get(key)
+                if style is None:
+                    for number in applied:
+                        attr, value = self._operations[number][:2]
+                        setattr(cell, attr, value)
+                    resolved[key] = copy(cell._style)
+                else:
+                    cell._style = copy(style)
+                formatted += 1
+
+        self._operations.clear()
+        return formatted
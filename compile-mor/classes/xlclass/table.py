@@ -0,0 +1,161 @@
+from itertools import zip_longest
+
+from openpyxl.utils import column_index_from_string
+
+
+class Table:
+    """Column-major table of a worksheet's cell values. Columns are read
+    from the sheet on first use (several at once in a single pass) and
+    stored as plain lists of values, so lookups index a list instead of
+    going through a Cell object and parsing a cell address each time.
+    """
+
+    __slots__ = ('_ws', '_stream', '_columns', '_width')
+
+    def __init__(self, ws: object, stream: bool = False) -> None:
+        """Wrap the passed worksheet. No values are read until a column
+        is needed.
+
+        Args:
+            ws (openpyxl.Workbook.worksheet): Worksheet (or ArraySheet)
+                to read values from.
+            stream (bool, optional): Read the columns in a single pass
+                over the rows, for read-only sheets whose cells can't be
+                addressed by column. Defaults to False.
+        """
+        self._ws = ws
+        self._stream = stream
+        self._columns = {}
+        self._width = None
+
+    @staticmethod
+    def _column_number(col: object) -> int:
+        """Return the column number for a column letter (or number)."""
+        if isinstance(col, int):
+            return col
+        return column_index_from_string(col.upper())
+
+    @property
+    def max_row(self) -> int:
+        """Number of rows in the longest loaded column."""
+        return max((len(values) for values in self._columns.values()),
+                   default=0)
+
+    def load(self, *cols: object) -> object:
+        """Read any of the passed columns that aren't loaded yet. Reads
+        every column of the sheet if none are passed.
+
+        Args:
+            *cols (str/int): Column letters (or numbers). ex: 'P', 'BF'
+
+        Returns:
+            self: Table object.
+        """
+        if not cols:
+            if self._width is None:
+                self._read_all()
+            return self
+
+        missing = sorted({self._column_number(col) for col in cols}
+                         - self._columns.keys())
+        if not missing:
+            return self
+
+        if self._stream:
+            # Stream the rows once, only parsing the needed column span
+            min_col, max_col = missing[0], missing[-1]
+            appends = [(self._columns.setdefault(number, []).append,
+                        number - min_col) for number in missing]
+            for values in self._ws.iter_rows(min_col=min_col,
+                                             max_col=max_col,
+                                             values_only=True):
+                for append, offset in appends:
+                    append(values[offset])
+        else:
+            for number in missing:
+                self._columns[number] = [value for (value,) in (
+                    self._ws.iter_rows(min_col=number, max_col=number,
+                                       values_only=True))]
+
+        return self
+
+    def _read_all(self) -> None:
+        """Read every column of the sheet in a single pass."""
+        rows = self._ws.iter_rows(values_only=True)
+        self._width = 0
+        for number, values in enumerate(zip_longest(*rows), 1):
+            self._columns.setdefault(number, list(values))
+            self._width = number
+
+    def discard(self, *cols: object) -> object:
+        """Drop loaded columns so they're read again on next use. Drops
+        every column if none are passed.
+
+        Args:
+            *cols (str/int): Column letters (or numbers). ex: 'B'
+
+        Returns:
+            self: Table object.
+        """
+        if not cols:
+            self._columns.clear()
+        for col in cols:
+            self._columns.pop(self._column_number(col), None)
+        self._width = None
+
+        return self
+
+    def column(self, col: object) -> list:
+        """Return the values of a column, first row first.
+
+        Args:
+            col (str/int): Column letter (or number). ex: 'A'
+
+        Returns:
+            list: Cell values of the column. Row 1 is at index 0.
+        """
+        number = self._column_number(col)
+        if number not in self._columns:
+            self.load(number)
+        return self._columns[number]
+
+    def value(self, col: object, row: int) -> object:
+        """Return a cell value by column letter and row number.
+
+        Args:
+            col (str/int): Column letter (or number). ex: 'A'
+            row (int): Row number. ex: 5
+
+        Returns:
+            object: Cell value. None if the cell is empty.
+        """
+        values = self.column(col)
+        return values[row - 1] if 0 < row <= len(values) else None
+
+    def rows(self, cols: list = None, startrow: int = 1,
+             stoprow: int = None):
+        """Generator yielding the row number and a tuple of values for
+        the passed columns (every column if none are passed).
+
+        Args:
+            cols (list(str/int), optional): Column letters (or numbers).
+                Defaults to None.
+            startrow (int, optional): First row. Defaults to 1.
+            stoprow (int, optional): Last row (inclusive). Defaults to
+                None.
+
+        Yields:
+            tuple(int, tuple): Row number and cell values in the same
+                order as cols.
+        """
+        if cols is None:
+            self.load()
+            numbers = range(1, self._width + 1)
+        else:
+            numbers = [self._column_number(col) for col in cols]
+            self.load(*numbers)
+
+        stop = stoprow if stoprow else self.max_row
+        columns = [self._columns[number][startrow - 1:stop]
+                   for number in numbers]
+        yield from enumerate(zip_longest(*columns), startrow)
@@ -1,41 +1,107 @@
 from pathlib import Path
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = False
-
 import openpyxl
 from openpyxl.utils import get_column_letter
-from openpyxl.utils.dataframe import dataframe_to_rows
 
+from .arraysheet import ArraySheet, ArrayWorkbook
+from .csvstream import CsvSheet, read_csv
+
+
+def select_sheet(sheetnames: list) -> str:
+    """Display the passed sheet names and return the one selected by
+    the user (the only one, without asking, if there's just one).
+
+    Args:
+        sheetnames (list(str)): Names of the workbook's sheets.
+
+    Returns:
+        str: Name of the selected sheet.
+    """
+    if len(sheetnames) == 1:
+        return sheetnames[0]
+
+    print('\n Which tab/worksheet are we using?\n')
+    for num, sheet in enumerate(sheetnames, 1):
+        print(f' {num}: {sheet}')
+
+    while True:
+        try:
+            return sheetnames[int(input('\n Selection: '))-1]
+        except ValueError:
+            print('\n Try again...')
+
+
+def _convert_rows(obj, filepath=None, rows=None, sheetname=None):
+    """Sets a read-only Xlsx object's sheet to row values read
+    elsewhere (ex: in another process), through an ArraySheet."""
+    obj.path = Path(filepath) if filepath else None
+    obj.read_only = True
+    obj.ws = ArraySheet(rows or [], sheetname or 'Sheet1')
+    obj.wb = ArrayWorkbook(obj.ws)
+
+
+def _convert_xls(obj, filepath=None, sheetname=None, read_only=False):
+    """Converts .xls data to Xlsx object. The sheet's rows are copied
+    from the DataFrame values as a whole (no index column/row is
+    added), so row numbers match the original file. Read-only objects
+    use the values directly through an ArraySheet instead of building
+    an Openpyxl Workbook."""
+    # Pandas is only imported when an .xls file is actually opened
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = False
 
-def _convert_xls(obj, filepath=None, sheetname=None):
-    """Converts .xls data to Xlsx object."""
     if not pd:
         input(".xls support requirements missing. Check requirements.txt")
         exit("Exiting...")
 
     # Convert xls to xlsx data using Pandas/Xlrd
-    if not filepath and sheetname:
-        input("Error converting from xls.\nBe sure to include the sheetname "
-              "when passing your filepath.")
+    if not filepath:
+        input("Error converting from xls.\nBe sure to include the filepath.")
         exit("Exiting...")
 
-    # Read data from xls and create xlsx object
-    df = pd.read_excel(filepath, sheet_name=sheetname)
+    # Read every row (including the first) as data, first sheet if no
+    # sheetname is passed, with empty cells as None instead of NaN
+    df = pd.read_excel(filepath, sheet_name=sheetname or 0, header=None)
+    rows = df.astype(object).where(df.notna(), None).values.tolist()
+    title = sheetname or 'Sheet1'
     obj.path = Path(filepath)
+
+    if read_only:
+        _convert_rows(obj, filepath, rows, title)
+        return
+
     obj.wb = openpyxl.Workbook()
     obj.ws = obj.wb.active
-    obj.ws.title = sheetname
+    obj.ws.title = title
 
     # Copy row data from xls to new xlsx object
-    for row in dataframe_to_rows(df):
+    for row in rows:
         obj.ws.append(row)
 
-    # Remove index row/colum created by Pandas
-    obj.ws.delete_cols(1, 1)
-    obj.ws.delete_rows(1, 1)
+
+def _convert_csv(obj, filepath=None, sheetname=None, read_only=False):
+    """Converts .csv data to Xlsx object, with numbers and dates
+    converted from text (see csvstream.read_csv). Read-only objects
+    stream the rows from the file through a CsvSheet on each pass
+    instead of building an Openpyxl Workbook, so large files are read in
+    bounded memory."""
+    title = sheetname or 'Sheet1'
+    obj.path = Path(filepath)
+
+    if read_only:
+        obj.read_only = True
+        obj.ws = CsvSheet(filepath, title)
+        obj.wb = ArrayWorkbook(obj.ws)
+        return
+
+    obj.wb = openpyxl.Workbook()
+    obj.ws = obj.wb.active
+    obj.ws.title = title
+
+    for row in read_csv(filepath):
+        obj.ws.append(row)
 
 
 def generate_columns_dictionary(key_list: list) -> dict:
@@ -1,13 +1,19 @@
-import csv
 import datetime
-import operator
 from pathlib import Path
 
 import openpyxl
-from openpyxl.styles import Border, Font, PatternFill, Side
-
-from .utils import (_convert_xls, _generate_source_target_columns_dictionary,
-                    generate_columns_dictionary)
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import column_index_from_string
+
+from .csvstream import csv_to_xlsx, read_csv
+from .index import ColumnIndex, LabelIndex
+from .sheetpatch import patch_sheet_values
+from .sorting import sort_rows
+from .styles import BOLD, CURRENCY, StyleBatch
+from .table import Table
+from .utils import (_convert_csv, _convert_rows, _convert_xls,
+                    _generate_source_target_columns_dictionary,
+                    generate_columns_dictionary, select_sheet)
 
 # Color dict for background fill
 COLORS = {'red': PatternFill(fgColor='FF0000', fill_type='solid'),
@@ -23,16 +29,24 @@ class Xlsx:
     as attributes for use with the enclosed methods.
     """
 
-    def __init__(self, filepath: str = None, sheetname: str = None) -> None:
+    def __init__(self, filepath: str = None, sheetname: str = None,
+                 read_only: bool = False) -> None:
         """Initialize main attributes for Xlsx objects if Path points to
         an existing Excel file. Creates a blank Workbook/Worksheet 
         object if no filepath is passed. If multiple sheets are present 
         in passed Excel file, the name of the sheet you want to work 
         with can be passed as a string to 'sheetname' or you can select 
         needed sheet from a menu. If the Excel file that is passed is an
-        *.xls file, sheetname is required and Pandas is used to read the
-        sheet data and a new unformatted Xlsx object is created 
-        containing that data. 
+        *.xls file, Pandas is used to read the sheet data (the first 
+        sheet if sheetname isn't passed) and a new unformatted Xlsx 
+        object is created containing that data. Lookup methods build a per-column index
+        the first time a column is searched and reuse it until a method 
+        writes to that column. If read_only is set, the *.xlsx file is 
+        opened in Openpyxl's streaming read-only mode with cell values 
+        only (no styles/formulas), which keeps large input files out of 
+        memory. Read-only objects only support the lookup methods 
+        (get_matching_value, search_matching_value, etc) and should be 
+        closed with *.close() when no longer needed.
 
         Attrs:
             *.path (pathlib.Path, optional): Filepath information.
@@ -40,21 +54,48 @@ class Xlsx:
             *.wb (openpyxl.Workbook): Workbook object for Excel file.
             *.ws (openpyxl.Workbook.worksheet): Active sheet for 
             Excel file.
+            *.read_only (bool): True if the Workbook was opened in 
+            read-only mode.
+            *._indexes (dict): Cached ColumnIndex objects by column 
+            letter.
+            *._table (Table): Column-major table of cell values read 
+            so far (see *.table()).
+            *._labels (LabelIndex): Cached header/row label index used
+            by search_matching_value.
+            *._written (set): Addresses of the cells set by
+            set_matching_value(s) since the last save (see 
+            *.save_values()).
 
         Args:
             filepath (str/pathlib.Path, optional): str/Path object 
             representing *.xlsx input file.
             sheetname (str, optional): Name representing which sheet you
             want to work with. ex: 'Invoice'
+            read_only (bool, optional): Open *.xlsx files in read-only,
+            values-only mode. *.xls files are read into an in-memory 
+            ArraySheet instead of a Workbook. Ignored for new blank 
+            objects. Defaults to False.
         """
+        self.read_only = False
+        self._indexes = {}
+        self._table = None
+        self._labels = None
+        self._written = set()
+
         if filepath:
             # Convert xls to xlsx data using Pandas/Xlrd
             if str(filepath).endswith(".xls"):
-                _convert_xls(self, filepath, sheetname)
+                _convert_xls(self, filepath, sheetname, read_only)
+
+            # Read csv data with numbers and dates converted
+            elif str(filepath).endswith(".csv"):
+                _convert_csv(self, filepath, sheetname, read_only)
 
             elif str(filepath).endswith(".xlsx"):
                 self.path = Path(filepath)
-                self.wb = openpyxl.load_workbook(filepath)
+                self.read_only = read_only
+                self.wb = openpyxl.load_workbook(
+                    filepath, read_only=read_only, data_only=read_only)
 
                 # Set first sheet as active if only one is present
                 if len(self.wb.sheetnames) == 1:
@@ -70,20 +111,10 @@ class Xlsx:
                         # Display availible sheets and set worksheet
                         # based on selection if 2+ sheets are present
                         # and sheetname isn't passed.
-                        print('\n Which tab/worksheet are we using?\n')
-                        for num, sheet in enumerate(self.wb.sheetnames, 1):
-                            print(f' {num}: {sheet}')
-
-                        while True:
-                            try:
-                                self.ws = self.wb[self.wb.sheetnames[int(
-                                    input('\n Selection: '))-1]]
-                                break
-                            except ValueError:
-                                print('\n Try again...')
+                        self.ws = self.wb[select_sheet(self.wb.sheetnames)]
 
             else:
-                input("File not supported. Please use .xlsx or xls.")
+                input("File not supported. Please use .xlsx, .xls or .csv.")
                 exit("Exiting...")
 
         else:
@@ -93,6 +124,27 @@ class Xlsx:
             self.wb = openpyxl.Workbook()
             self.ws = self.wb.active
 
+    @classmethod
+    def from_rows(cls, rows: list, filepath: str = None,
+                  sheetname: str = None) -> object:
+        """Return a read-only Xlsx object for sheet values that were read
+        elsewhere (ex: by another process), backed by an ArraySheet.
+
+        Args:
+            rows (list(tuple)): Row values, first row first.
+            filepath (str/pathlib.Path, optional): File the values were
+            read from. Defaults to None.
+            sheetname (str, optional): Name of the sheet. Defaults to
+            None ('Sheet1').
+
+        Returns:
+            Xlsx: Read-only Xlsx object.
+        """
+        xlsx = cls()
+        _convert_rows(xlsx, filepath, rows, sheetname)
+
+        return xlsx
+
     def save(self, savepath: str = None) -> None:
         """Duplicates openpyxl's save function so it can be called on the 
         object without needing the .wb attribute, etc. Saves the Excel 
@@ -111,6 +163,126 @@ class Xlsx:
             self.wb.save(self.path)
         else:
             input("\n No savepath found...")
+            return
+        self._written.clear()
+
+    def save_values(self, savepath: str = None) -> None:
+        """Saves only the cells set with set_matching_value(s) by
+        rewriting the active sheet's XML inside the original *.xlsx file
+        instead of re-serializing the whole workbook. Every other sheet,
+        style and part of the file is copied unchanged, and formulas are
+        recalculated when the file is next opened. Falls back to *.save()
+        for new or converted objects, if the sheet XML can't be patched,
+        or if a formula cell is overwritten with a value. Changes made by
+        other methods aren't saved.
+
+        Args:
+            savepath (str or pathlib.Path, optional): Output file
+                location (including filename) for your output file. Uses
+                original if not specified. Defaults to None.
+        """
+        if (self.read_only or not self.path
+                or self.path.suffix != '.xlsx'):
+            self.save(savepath)
+            return
+
+        values = {coordinate: self.ws[coordinate].value
+                  for coordinate in self._written}
+        try:
+            patch_sheet_values(self.path, self.ws.title, values, savepath)
+        except (KeyError, ValueError):
+            self.save(savepath)
+            return
+        self._written.clear()
+
+    def close(self) -> None:
+        """Duplicates openpyxl's close function so it can be called on 
+        the object without needing the .wb attribute. Releases the source
+        file held open by read-only objects.
+        """
+        self.wb.close()
+
+    def style_batch(self) -> StyleBatch:
+        """Return a StyleBatch for the sheet. Several formatting 
+        operations can be added to it and applied in a single pass over
+        the sheet, with each distinct style only resolved once. The 
+        formatting methods (set_bold_rows, highlight_rows, etc) each use
+        a one-operation batch.
+
+            xlsx.style_batch().font(BOLD, stoprow=2).fill(
+                COLORS['gray'], startrow=2, step=2).border().apply()
+
+        Returns:
+            StyleBatch: Empty batch of formatting operations.
+        """
+        return StyleBatch(self.ws)
+
+    def table(self, *cols: str) -> Table:
+        """Return the column-major Table of the sheet's cell values,
+        reading any of the passed columns (every column if none are 
+        passed) that haven't been read yet. Read-only objects read all
+        of the passed columns in a single pass over the rows. Columns 
+        stay loaded until a method writes to them.
+
+        Args:
+            *cols (str): Column letters to read. ex: 'P', 'BF'
+
+        Returns:
+            Table: Column values of the sheet.
+        """
+        if self._table is None:
+            self._table = Table(self.ws, stream=self.read_only)
+
+        return self._table.load(*cols)
+
+    def _column_index(self, col: str, *retcols: str) -> ColumnIndex:
+        """Return the lookup index for a column, building it on first 
+        use. The passed return columns are read into the table in the 
+        same pass (so read-only objects only stream the sheet once).
+
+        Args:
+            col (str): Column letter to index. ex: 'A'
+            *retcols (str): Column letters values will be read from.
+
+        Returns:
+            ColumnIndex: Index of the column's values.
+        """
+        col = col.upper()
+        table = self.table(col, *retcols)
+
+        if col not in self._indexes:
+            self._indexes[col] = ColumnIndex(
+                {row: value for row, value in enumerate(table.column(col), 1)
+                 if value is not None})
+
+        return self._indexes[col]
+
+    def _get_value(self, col: str, row: int) -> object:
+        """Return a cell value by column letter and row number from the
+        table (without creating or addressing a Cell object)."""
+        return self.table(col).value(col, row)
+
+    def clear_index(self, *cols: str) -> object:
+        """Discard cached column indexes (and table columns) so they're
+        rebuilt on the next lookup. The Xlsx methods do this automatically; call it after 
+        writing to cells directly through the *.ws attribute.
+
+        Args:
+            *cols (str): Column letters to discard. Discards all indexes
+            if none are passed.
+
+        Returns:
+            self: Xlsx object.
+        """
+        if not cols:
+            self._indexes.clear()
+        for col in cols:
+            self._indexes.pop(col.upper(), None)
+        if self._table is not None:
+            self._table.discard(*cols)
+        self._labels = None
+
+        return self
 
     def generate_headers_attribute(self, header_row: int = 1) -> object:
         """Uses specified header row number to generate a *.headers 
@@ -139,7 +311,11 @@ class Xlsx:
 
     def copy_sheet_data(self, source: object, columns: dict) -> object:
         """Copy cell values from source Excel Worksheet to target (self)
-        Excel Worksheet using a passed dictionary of column letters.
+        Excel Worksheet using a passed dictionary of column letters. The
+        source rows are streamed once (values only, just the span of the
+        source columns) and each value is written to the same row of the
+        target. Rows past the end of the target are appended in bulk. 
+        Works with read-only source objects.
 
         Args:
             source (Xlsx): Input Xlsx Excel file object to copy values from.
@@ -150,10 +326,26 @@ class Xlsx:
         Returns:
             self: Xlsx object.
         """
-        for row, _cell in enumerate(source.ws['A'], 1):
-            for scol, tcol in columns.items():
-                self.ws[f'{tcol.upper()}{row}'] = source.ws[
-                    f'{scol.upper()}{row}'].value
+        if not columns:
+            return self
+
+        scols = [column_index_from_string(col.upper()) for col in columns]
+        tcols = [column_index_from_string(col.upper())
+                 for col in columns.values()]
+        min_col = min(scols)
+        offsets = [col - min_col for col in scols]
+        pairs = list(zip(tcols, offsets))
+        target_rows = self.ws.max_row
+
+        for row, values in enumerate(source.ws.iter_rows(
+                min_col=min_col, max_col=max(scols), values_only=True), 1):
+            if row <= target_rows:
+                for tcol, offset in pairs:
+                    self.ws.cell(row=row, column=tcol).value = values[offset]
+            else:
+                self.ws.append({tcol: values[offset]
+                                for tcol, offset in pairs})
+        self.clear_index(*columns.values())
 
         return self
 
@@ -182,46 +374,88 @@ class Xlsx:
 
         return self
 
-    def copy_csv_data(self, source_csv: str) -> object:
+    def copy_csv_data(self, source_csv: str, encoding: str = None,
+                      delimiter: str = None, infer_types: bool = True,
+                      header_rows: int = 1, savepath: str = None) -> object:
         """Copy all values from source csv file to target Excel Worksheet.
+        Rows are streamed from the file one at a time, with numbers and
+        dates converted as they're read (see csvstream.read_csv), so
+        number_type_fix isn't needed afterwards. If a savepath is passed
+        and the object is new and empty, the rows are written straight
+        to that *.xlsx file through Openpyxl's write-only mode (see
+        csvstream.csv_to_xlsx) and the object is reopened read-only from
+        it, so the rows are never held in memory.
 
         Args:
             source_csv (str/pathlib.Path): Path object representing a csv file.
+            encoding (str, optional): Encoding of the file. Detected from
+                the file if not passed. Defaults to None.
+            delimiter (str, optional): Value delimiter. Detected from
+                the file if not passed. Defaults to None.
+            infer_types (bool, optional): Convert numbers and dates.
+                Defaults to True.
+            header_rows (int, optional): Number of rows at the start of
+                the file kept as text. Defaults to 1.
+            savepath (str/pathlib.Path, optional): *.xlsx file to write
+                the rows of a new, empty object to. Defaults to None.
 
         Returns:
             self: Xlsx object.
         """
-        with open(source_csv, 'r') as f:
-            reader = csv.reader(f)
-            [self.ws.append(row) for row in reader]
+        if (savepath and self.path is None and self.ws.max_row == 1
+                and self.ws['A1'].value is None):
+            csv_to_xlsx(source_csv, savepath, self.ws.title,
+                        encoding=encoding, delimiter=delimiter,
+                        infer_types=infer_types, header_rows=header_rows)
+            self.path = Path(savepath)
+            self.read_only = True
+            self.wb = openpyxl.load_workbook(
+                savepath, read_only=True, data_only=True)
+            self.ws = self.wb.active
+            self._table = None
+            self.clear_index()
+            return self
+
+        for row in read_csv(source_csv, encoding, delimiter, infer_types,
+                            header_rows):
+            self.ws.append(row)
+        self.clear_index()
 
         return self
 
-    def sort_and_replace(self, sortcol: str, startrow: int = 1) -> object:
-        """Sort and replace cell values based on values of a specific 
-        column. Use this BEFORE any cell formatting, etc as it DELETES 
-        the values and then replaces them after sorting.
+    def sort_and_replace(self, sortcol: object, startrow: int = 1,
+                         reverse: bool = False) -> object:
+        """Sort and replace cell values based on values of one or more
+        columns. The rows' values are read in a single pass, sorted 
+        (numbers and dates by value, text case-insensitively, empty 
+        cells last) and written back into the same cells, skipping cells
+        that already hold their new value. Only values are moved, so use
+        this BEFORE any cell formatting, etc.
 
         Args:
-            sortcol (str): Column letter containing the values to use as
-                "keys" to sort row data by. ex: 'A'
+            sortcol (str/list(str)): Column letter (or letters, most 
+                significant first) containing the values to use as 
+                "keys" to sort row data by. ex: 'A', ['C', 'A']
             startrow (int, optional): Starting row number where values 
                 begin. Defaults to 1.
+            reverse (bool, optional): Sort in descending order (empty
+                cells still last). Defaults to False.
 
         Returns:
             self: Xlsx object.
         """
-        sortme = []
-        for row, rowdata in enumerate(self.ws.iter_rows(), 1):
-            if row >= startrow:
-                sortme.append([str(self.ws[
-                    f'{sortcol.upper()}{row}'].value).lower(), rowdata])
-
-        self.ws.delete_rows(startrow, self.ws.max_row)
-
-        for _sortval, rowdata in sorted(
-                sortme, key=operator.itemgetter(0)):
-            self.ws.append(rowdata)
+        sortcols = [sortcol] if isinstance(sortcol, str) else sortcol
+        positions = [column_index_from_string(col.upper()) - 1
+                     for col in sortcols]
+        cells = list(self.ws.iter_rows(min_row=startrow))
+        rows = sort_rows([tuple(cell.value for cell in cellrow)
+                          for cellrow in cells], positions, reverse)
+
+        for cellrow, values in zip(cells, rows):
+            for cell, value in zip(cellrow, values):
+                if cell.value is not value:
+                    cell.value = value
+        self.clear_index()
 
         return self
 
@@ -242,6 +476,7 @@ class Xlsx:
         """
         for col, name in headers.items():
             self.ws[f'{col.upper()}{hdrrow}'] = name
+        self.clear_index(*headers)
         if bold:
             for each in self.ws[f'{hdrrow}:{hdrrow}']:
                 each.font = Font(bold=True)
@@ -249,7 +484,8 @@ class Xlsx:
         return self
 
     def set_matching_value(self, srchcol: str, srchval: str, trgtcol: str,
-                           setval: str, startrow: int = 1) -> object:
+                           setval: str, startrow: int = 1,
+                           match: str = 'substring') -> object:
         """Search column for a value and set a corresponding value in 
         another column in the same row.
 
@@ -261,17 +497,56 @@ class Xlsx:
             setval (str): Value to insert into target cell.
             startrow (int, optional): Starting row number where values 
                 begin. Defaults to 1.
+            match (str, optional): 'exact', 'prefix' or 'substring' 
+                match of the search value. Defaults to 'substring'.
 
         Returns:
             self: Xlsx object.
         """
-        for row, cell in enumerate(self.ws[srchcol.upper()], 1):
-            if row >= startrow and cell.value:
-                if srchval in str(cell.value):
-                    self.ws[f'{trgtcol.upper()}{row}'] = setval
+        for row in self._column_index(srchcol).find(srchval, match, startrow):
+            self.ws[f'{trgtcol.upper()}{row}'] = setval
+            self._written.add(f'{trgtcol.upper()}{row}')
+        self.clear_index(trgtcol)
 
         return self
 
+    def set_matching_values(self, srchcol: str, mapping: dict, trgtcol: str,
+                            startrow: int = 1,
+                            match: str = 'substring') -> dict:
+        """Search column for each key of the passed dictionary and set
+        its value in another column of every matching row. The search
+        column is indexed once for all keys instead of being rescanned
+        for each one. Returns the matching row numbers for each key so
+        keys that matched no rows (or more than one) can be reported.
+
+        Args:
+            srchcol (str): Column letter to search for values. ex: 'A'
+            mapping (dict{str: any}): Dictionary of search values and the
+                values to insert into the target cells.
+                ex: {'Total': 100}
+            trgtcol (str): Column letter to set with corresponding
+                values. ex: 'B'
+            startrow (int, optional): Starting row number where values
+                begin. Defaults to 1.
+            match (str, optional): 'exact', 'prefix' or 'substring'
+                match of the search values. Defaults to 'substring'.
+
+        Returns:
+            dict: Dictionary of search values and lists of the row
+                numbers that were set. {srchval: [row, row]}
+        """
+        index = self._column_index(srchcol)
+        matches = {}
+
+        for srchval, setval in mapping.items():
+            matches[srchval] = index.find(srchval, match, startrow)
+            for row in matches[srchval]:
+                self.ws[f'{trgtcol.upper()}{row}'] = setval
+                self._written.add(f'{trgtcol.upper()}{row}')
+        self.clear_index(trgtcol)
+
+        return matches
+
     def find_remove_row(self, col: str,
                         srch: str, startrow: int = 1) -> object:
         """Remove row based on a specific value found in a column.
@@ -294,6 +569,7 @@ class Xlsx:
                     row += 1
             else:
                 row += 1
+        self.clear_index()
 
         return self
 
@@ -316,15 +592,17 @@ class Xlsx:
         """
         if not skip:
             skip = []
-        for row, cell in enumerate(self.ws[col.upper()], 1):
-            if row >= startrow:
-                if cell.value and str(cell.value).lower() not in skip:
-                    for find, replace in fndrplc.items():
-                        if find in str(cell.value):
-                            self.ws[
-                                f'{col.upper()}{row}'
-                            ] = str(cell.value).replace(
-                                find, replace)
+        # Only visit rows containing at least one of the find values
+        index = self._column_index(col)
+        rows = {row for find in fndrplc for row in index.find(
+            find, startrow=startrow)}
+        for row in sorted(rows):
+            cell = self.ws[f'{col.upper()}{row}']
+            if cell.value and str(cell.value).lower() not in skip:
+                for find, replace in fndrplc.items():
+                    if find in str(cell.value):
+                        cell.value = str(cell.value).replace(find, replace)
+        self.clear_index(col)
 
         return self
 
@@ -346,15 +624,18 @@ class Xlsx:
         Returns:
             self: Xlsx object.
         """
-        for row, cell in enumerate(self.ws[scol.upper()], 1):
-            if cell.value and row >= startrow:
-                for item in vals:
-                    if item in str(cell.value):
-                        self.ws[f'{tcol.upper()}{row}'] = item
-                        self.ws[
-                            f'{scol.upper()}{row}'] = cell.value.replace(
-                            item, '')
-                        break
+        # Only visit rows containing at least one of the values
+        index = self._column_index(scol)
+        rows = {row for item in vals for row in index.find(
+            item, startrow=startrow)}
+        for row in sorted(rows):
+            cell = self.ws[f'{scol.upper()}{row}']
+            for item in vals:
+                if item in str(cell.value):
+                    self.ws[f'{tcol.upper()}{row}'] = item
+                    cell.value = cell.value.replace(item, '')
+                    break
+        self.clear_index(scol, tcol)
 
         return self
 
@@ -386,6 +667,7 @@ class Xlsx:
             self.ws[
                 f"{datacol.upper()}{row}"
             ] = f"{split_value[1].strip()} {split_value[0].strip()}"
+        self.clear_index(datacol)
 
         return self
 
@@ -424,11 +706,13 @@ class Xlsx:
                 new_value = str(cell.value).replace(char, "")
             # Replace cell value with new version
             self.ws[f"{datacol.upper()}{row}"] = new_value
+        self.clear_index(datacol)
 
         return self
 
     def get_matching_value(self, srchcol: str, srchval: str,
-                           retcol: str, startrow: int = 1) -> str:
+                           retcol: str, startrow: int = 1,
+                           match: str = 'substring') -> str:
         """Search column for a value and return the corresponding value
         from another column in the same row.
 
@@ -439,48 +723,85 @@ class Xlsx:
                 value to be returned. ex: 'B'
             startrow (int, optional): Starting row number where values 
                 begin. Defaults to 1.
+            match (str, optional): 'exact', 'prefix' or 'substring' 
+                match of the search value. Defaults to 'substring'.
 
         Returns:
             str: Value from corresponding cell in the same row as search
                 value. Returns False if value search value is not found.
         """
-        for row, cell in enumerate(self.ws[srchcol.upper()], 1):
-            if row >= startrow and cell.value:
-                if srchval in str(cell.value):
-                    return self.ws[f'{retcol.upper()}{row}'].value
+        rows = self._column_index(srchcol, retcol).find(
+            srchval, match, startrow)
+        if rows:
+            return self._get_value(retcol, rows[0])
 
         return False
 
+    def get_matching_values(self, srchcol: str, srchvals: list,
+                            retcols: list, startrow: int = 1,
+                            match: str = 'substring') -> dict:
+        """Search column for several values at once and return the
+        corresponding values from each of the return columns in the same
+        row. The search column (and return columns for read-only objects)
+        are indexed in a single pass over the sheet instead of one scan 
+        per search value and column. Matches the same way as 
+        get_matching_value (first matching row).
+
+        Args:
+            srchcol (str): Column letter to search for values. ex: 'P'
+            srchvals (list(str)): Values to search column for.
+                ex: ['E1234', 'E5678']
+            retcols (list(str)): Column letters containing the
+                corresponding values to be returned. ex: ['BF', 'BK']
+            startrow (int, optional): Starting row number where values
+                begin. Defaults to 1.
+            match (str, optional): 'exact', 'prefix' or 'substring' 
+                match of the search values. Defaults to 'substring'.
+
+        Returns:
+            dict: Dictionary of search values and dictionaries of return
+                columns and their values. {srchval: {retcol: value}}
+                Values are False for search values that aren't found.
+        """
+        index = self._column_index(srchcol, *retcols)
+        results = {}
+
+        for srchval in srchvals:
+            rows = index.find(srchval, match, startrow)
+            results[srchval] = {
+                retcol: self._get_value(retcol, rows[0]) if rows else False
+                for retcol in retcols}
+
+        return results
+
     def search_matching_value(self, header_srch_value: str,
                               row_srch_value: str) -> str:
-        """Searches cells by row for header search value and row search 
-        value, and returns corresponding cell value matching both as
-        a string.
+        """Returns the value (as a string) of the cell where the column
+        of the header search value and the row of the row search value
+        intersect. Headers and row labels are matched exactly (whole 
+        numbers are normalized, so 2024, 2024.0 and '2024.0' match the 
+        same header) using a LabelIndex built once for the sheet, so 
+        repeated lookups don't rescan it.
 
         Args:
-            header_srch_value (str): Header name to search for.
+            header_srch_value (str/int): Header name to search for.
             row_srch_value (str): Row name to search for.
 
         Returns:
             str: Matching (intersecting) value corresponding to the
-            searched header and row value. Returns False if not found.
+            searched header and row value. Returns False if either isn't
+            found or the intersecting cell is empty.
         """
-        search_column, search_row = 0, 0
-
-        for row in self.ws.iter_rows():
-            for cell_number, cell_data in enumerate(row, 1):
-                if str(cell_data.value) == header_srch_value:
-                    search_column += cell_number
-
-                if str(cell_data.value) == row_srch_value:
-                    search_row = True
+        if self._labels is None:
+            self._labels = LabelIndex(self.table().rows())
 
-                if search_row:
-                    if cell_number == search_column:
-                        return str(cell_data.value)
+        column = self._labels.column(header_srch_value)
+        row = self._labels.row(row_srch_value)
+        if not column or not row:
+            return False
 
-        # In case search isn't located.
-        return False
+        value = self.table().value(column, row)
+        return str(value) if value is not None else False
 
     def verify_length(self, col: str, length: int, fillcolor: str,
                       skip: list = None, startrow: int = 1,
@@ -503,20 +824,20 @@ class Xlsx:
         Returns:
             self: Xlsx object.
         """
-        if not stoprow:
-            stoprow = self.ws.max_row
         if not skip:
             skip = []
-        if COLORS.get(fillcolor.lower()):
-            for row, cell in enumerate(self.ws[col.upper()], 1):
-                if startrow <= row <= stoprow:
-                    if cell.value and str(cell.value).lower() not in skip:
-                        if len(str(cell.value)) != length:
-                            self.ws[
-                                f'{col.upper()}{row}'].fill = COLORS.get(
-                                fillcolor.lower())
-        else:
+        if not COLORS.get(fillcolor.lower()):
             print(f" Color '{fillcolor}' not available.")
+            return self
+
+        def wrong_length(value):
+            return (value and str(value).lower() not in skip
+                    and len(str(value)) != length)
+
+        self.style_batch().fill(
+            COLORS.get(fillcolor.lower()), startrow=startrow,
+            stoprow=stoprow + 1 if stoprow else 0, col=col,
+            when=wrong_length).apply()
 
         return self
 
@@ -538,12 +859,10 @@ class Xlsx:
             self: Xlsx object.
         """
         if COLORS.get(fillcolor.lower()):
-            for row, cell in enumerate(self.ws[col.upper()], 1):
-                if row >= startrow:
-                    if cell.value and srch.lower() in str(
-                            cell.value).lower():
-                        for each in self.ws[f'{row}:{row}']:
-                            each.fill = COLORS.get(fillcolor.lower())
+            for row in self._column_index(col).find(
+                    srch, startrow=startrow, ignore_case=True):
+                for each in self.ws[f'{row}:{row}']:
+                    each.fill = COLORS.get(fillcolor.lower())
         else:
             print(f" Color '{fillcolor}' not available.")
 
@@ -571,6 +890,7 @@ class Xlsx:
                     self.ws[f'{col.upper()}{row}'] = int(cell.value)
                 if numtype.lower() == 'f':
                     self.ws[f'{col.upper()}{row}'] = float(cell.value)
+        self.clear_index(col)
 
         return self
 
@@ -589,6 +909,7 @@ class Xlsx:
             if row >= startrow and cell.value:
                 self.ws[f'{col.upper()}{row}'] = cell.value.strftime(
                     '%m/%d/%Y')
+        self.clear_index(col)
 
         return self
 
@@ -606,12 +927,10 @@ class Xlsx:
         Returns:
             self: Xlsx object.
         """
-        if not stoprow:
-            stoprow = self.ws.max_row
-
-        for row, cell in enumerate(self.ws[col.upper()], 1):
-            if startrow <= row <= stoprow and cell.value:
-                cell.number_format = '$#,###.00'
+        self.style_batch().number_format(
+            CURRENCY, startrow=startrow,
+            stoprow=stoprow + 1 if stoprow else 0, col=col,
+            when=bool).apply()
 
         return self
 
@@ -656,13 +975,8 @@ class Xlsx:
         Returns:
             self: Xlsx object.
         """
-        for row_number, row in enumerate(self.ws.iter_rows(), 1):
-            if row_number < startrow:
-                continue
-            if stoprow and row_number == stoprow:
-                break
-            for cell in row:
-                cell.font = Font(bold=True)
+        self.style_batch().font(
+            BOLD, startrow=startrow, stoprow=stoprow).apply()
 
         return self
 
@@ -691,19 +1005,9 @@ class Xlsx:
             print(f"Color: '{fillcolor}' not available.")
             return self
 
-        highlight_row = startrow
-        for row_number, row in enumerate(self.ws.iter_rows(), 1):
-            if row_number < startrow:
-                continue
-            if row_number == stoprow:
-                break
-            if row_number == highlight_row:
-                for cell in row:
-                    cell.fill = COLORS.get(fillcolor.lower())
-                if not alternate:
-                    highlight_row += 1
-                else:
-                    highlight_row += 2
+        self.style_batch().fill(
+            COLORS.get(fillcolor.lower()), startrow=startrow,
+            stoprow=stoprow, step=2 if alternate else 1).apply()
 
         return self
 
@@ -719,9 +1023,7 @@ class Xlsx:
         Returns:
             self: Xlsx object.
         """
-        for row in self.ws.iter_rows():
-            for cell in row:
-                cell.font = Font(name=fontname, size=str(size))
+        self.style_batch().font(Font(name=fontname, size=str(size))).apply()
 
         return self
 
@@ -739,16 +1041,7 @@ class Xlsx:
         Returns:
             self: Xlsx object
         """
-        for row_num, row_data in enumerate(self.ws.iter_rows(), 1):
-            if row_num < startrow:
-                continue
-            if stoprow and row_num == stoprow:
-                break
-            for cell in row_data:
-                cell.border = Border(left=Side(style='thin'),
-                                     right=Side(style='thin'),
-                                     top=Side(style='thin'),
-                                     bottom=Side(style='thin'))
+        self.style_batch().border(startrow=startrow, stoprow=stoprow).apply()
 
         return self
 
@@ -782,13 +1075,15 @@ class Xlsx:
         data = {}
         keycolumn = keycol if keycol else 'A'
         datastart = hdrrow + 1 if not datastartrow else datastartrow
+        table = self.table(keycolumn, *datacols)
+        headers = [table.value(ea, hdrrow) for ea in datacols]
+        columns = [table.column(ea) for ea in datacols]
 
-        for row, cell in enumerate(self.ws[keycolumn.upper()], 1):
-            keys = cell.value if keycol else f"{row:0>4}"
+        for row, value in enumerate(table.column(keycolumn), 1):
+            keys = value if keycol else f"{row:0>4}"
             if row >= datastart and keys:
-                data[keys] = {
-                    self.ws[f'{ea.upper()}{hdrrow}'].value: self.ws[
-                        f'{ea.upper()}{row}'].value for ea in datacols}
+                data[keys] = {header: column[row - 1] for header, column
+                              in zip(headers, columns)}
 
         return data
 
@@ -807,8 +1102,5 @@ class Xlsx:
         Returns:
             list: List of lists containing the values read from cells.
         """
-        row_data = []
-        for row in self.ws.iter_rows(min_row=startrow, max_row=stoprow):
-            row_data.append([cell.value for cell in row])
-
-        return row_data
+        return [list(values) for _row, values in self.table().rows(
+            startrow=startrow, stoprow=stoprow)]
@@ -8,8 +8,19 @@ DEFAULTS = {
     "using default values": True,
     "write log file": True,
     "open output file": True,
+    "parallel file loading": False,
+    "cache source files": True,
+    "cache max entries": 50,
+    "cache max age days": 90,
+    "trace stages": False,
+    "record history": True,
+    "log format": "jsonl",
+    "log max bytes": 1000000,
+    "log backups": 5,
     "grayscale volume regex": "(Grayscale:\\s)((\\d{1,3},)?(\\d{1,3},)?(\\d{1,3}))",
     "color volume regex": "(Color:\\s)((\\d{1,3},)?(\\d{1,3},)?(\\d{1,3}))",
+    "executive summary max pages": 3,
+    "executive summary bbox": None,
     "production info": {
         "bw machine 1": {
             "name": "BW1",
@@ -10,19 +10,27 @@ from config.defaults import DEFAULTS
 from utils.loadconfig import load_config
 
 
-def get_configuration_data() -> ConfigData:
+def get_configuration_data(
+    app_files: Path | None = None, working_folder: Path | None = None
+) -> ConfigData:
     """
     Generates and returns configuration data.
 
     This function loads configuration data from a JSON file, applies default values,
     and returns a ConfigData object containing various configuration settings.
 
+    Args:
+        app_files (Path | None, optional): Folder containing config.json and MOR_Numbers.xlsx.
+            Defaults to ~/PyAppFiles/Compile MOR.
+        working_folder (Path | None, optional): Folder containing the data source files.
+            Defaults to ~/Downloads.
+
     Returns:
         ConfigData: An object containing configuration data.
     """
     today = date.today()
-    working_folder = Path().home() / "Downloads"
-    app_files = Path().home() / "PyAppFiles" / "Compile MOR"
+    working_folder = Path(working_folder or Path().home() / "Downloads")
+    app_files = Path(app_files or Path().home() / "PyAppFiles" / "Compile MOR")
     json_filepath = app_files / "config.json"
     json_data = load_config(json_path=json_filepath, default_data=DEFAULTS)
 
@@ -33,8 +41,31 @@ def get_configuration_data() -> ConfigData:
         open_output_file=json_data["open output file"],
         bw_vol_regex=json_data["grayscale volume regex"],
         color_vol_regex=json_data["color volume regex"],
+        pdf_max_pages=json_data.get(
+            "executive summary max pages", DEFAULTS["executive summary max pages"]
+        ),
+        pdf_bbox=json_data.get(
+            "executive summary bbox", DEFAULTS["executive summary bbox"]
+        ),
         production_info=json_data["production info"],
         app_files=app_files,
         working_folder=working_folder,
         default_values=json_data["using default values"],
+        parallel_loading=json_data.get(
+            "parallel file loading", DEFAULTS["parallel file loading"]
+        ),
+        cache_source_files=json_data.get(
+            "cache source files", DEFAULTS["cache source files"]
+        ),
+        cache_max_entries=json_data.get(
+            "cache max entries", DEFAULTS["cache max entries"]
+        ),
+        cache_max_age_days=json_data.get(
+            "cache max age days", DEFAULTS["cache max age days"]
+        ),
+        trace_stages=json_data.get("trace stages", DEFAULTS["trace stages"]),
+        record_history=json_data.get("record history", DEFAULTS["record history"]),
+        log_format=json_data.get("log format", DEFAULTS["log format"]),
+        log_max_bytes=json_data.get("log max bytes", DEFAULTS["log max bytes"]),
+        log_backups=json_data.get("log backups", DEFAULTS["log backups"]),
     )
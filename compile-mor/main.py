@@ -4,15 +4,33 @@ Main module for the Compile-MOR application.
 This module handles the initialization and execution of the MOR compilation process.
 It includes functions for displaying messages, calculating various totals, writing output files,
 writing log files, and opening the output file if configured to do so.
+
+Run with --answers <file.json> to compile without user prompts (see samples/answers.json), with
+--incremental to only recalculate the totals whose inputs changed since the last run, or
+with --sites <folder> [<folder> ...] to compile several sites in parallel, each folder holding its
+own config.json, answers.json, MOR_Numbers.xlsx and data source files.
 """
 
 __version__ = "1.1.0"
 
+import time
+
+# Measured for --import-times
+_IMPORT_START = time.perf_counter()
+
+import argparse
+import multiprocessing
+import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 from classes import MOR, ConfigData, FileObj
 from config import get_configuration_data
 from modules import (
+    HistoryStore,
+    RunState,
+    SourceCache,
     calculate_fleet_totals,
     calculate_mail_totals,
     calculate_mps_totals,
@@ -21,10 +39,33 @@ from modules import (
     display_first_run_message,
     display_welcome_message,
     get_file_objects,
+    input_fingerprints,
+    load_answers,
+    log_file_path,
+    log_totals,
+    optional_totals,
     output_py,
+    output_trace,
+    reopen_output_file,
+    reporting_month,
+    write_log_record,
     write_output_file,
+    write_summary_file,
+)
+from utils import (
+    clear_screen,
+    open_file,
+    prompts_disabled,
+    time_imports,
+    traced_stage,
+    tracing,
+    warm_imports,
 )
-from utils import clear_screen, open_file
+from utils.importtimer import HEAVY_MODULES
+from utils.stagetrace import StageTrace
+
+_IMPORT_TIME = time.perf_counter() - _IMPORT_START
+_EAGER_IMPORTS = [module for module in HEAVY_MODULES if module in sys.modules]
 
 warnings.simplefilter("ignore")
 
@@ -32,6 +73,7 @@ warnings.simplefilter("ignore")
 def display_messages(default_flag: bool, file_path: str) -> None:
     """
     Clears the screen, displays ASCII art and a welcome message, then waits for user input.
+    The heavy libraries are imported in the background while waiting.
 
     Args:
         default_flag (bool): Flag indicating if default values are used.
@@ -42,6 +84,7 @@ def display_messages(default_flag: bool, file_path: str) -> None:
         display_first_run_message(file_path)
     display_ascii_art(__version__)
     display_welcome_message()
+    warm_imports()
     input()
 
 
@@ -59,7 +102,42 @@ def compile_totals(mor: MOR) -> dict:
     return {key: value for _dict in dicts_list for key, value in _dict.items()}
 
 
-def calculate_fleet(files: FileObj, mor: MOR, CONFIG: ConfigData) -> None:
+def load_files(CONFIG: ConfigData) -> FileObj:
+    """
+    Loads the data source files and starts reading the executive summary PDF.
+
+    Args:
+        CONFIG (ConfigData): Configuration data including file locations, PDF and cache settings.
+
+    Returns:
+        FileObj: The file objects containing data.
+    """
+    cache = None
+    if CONFIG.cache_source_files:
+        cache = SourceCache(
+            cache_file=CONFIG.app_files / "source_cache.json",
+            max_entries=CONFIG.cache_max_entries,
+            max_age_days=CONFIG.cache_max_age_days,
+        )
+
+    return get_file_objects(
+        app_files=CONFIG.app_files,
+        working_folder=CONFIG.working_folder,
+        parallel=CONFIG.parallel_loading,
+        pdf_options={
+            "bw_regex": CONFIG.bw_vol_regex,
+            "color_regex": CONFIG.color_vol_regex,
+            "max_pages": CONFIG.pdf_max_pages,
+            "bbox": CONFIG.pdf_bbox,
+        },
+        cache=cache,
+        log_format=CONFIG.log_format,
+    )
+
+
+def calculate_fleet(
+    files: FileObj, mor: MOR, CONFIG: ConfigData, answers: dict | None = None
+) -> None:
     """
     Calculates fleet totals and updates the MOR object.
 
@@ -67,16 +145,24 @@ def calculate_fleet(files: FileObj, mor: MOR, CONFIG: ConfigData) -> None:
         files (FileObj): The file objects containing data.
         mor (MOR): The MOR object to be updated.
         CONFIG (ConfigData): Configuration data including regex patterns for volume calculations.
+        answers (dict | None, optional): Answers to use instead of prompting the user.
     """
     calculate_fleet_totals(
         exec_summary=files.executive_summary_p,
         data=mor.fleet_data,
         bw_vol_regex=CONFIG.bw_vol_regex,
         color_vol_regex=CONFIG.color_vol_regex,
+        page_text=files.executive_summary_text,
+        max_pages=CONFIG.pdf_max_pages,
+        bbox=CONFIG.pdf_bbox,
+        cache=files.source_cache,
+        answers=answers,
     )
 
 
-def calculate_production(files: FileObj, mor: MOR, CONFIG: ConfigData) -> None:
+def calculate_production(
+    files: FileObj, mor: MOR, CONFIG: ConfigData, answers: dict | None = None
+) -> None:
     """
     Calculates production totals and updates the MOR object.
 
@@ -84,6 +170,7 @@ def calculate_production(files: FileObj, mor: MOR, CONFIG: ConfigData) -> None:
         files (FileObj): The file objects containing data.
         mor (MOR): The MOR object to be updated.
         CONFIG (ConfigData): Configuration data including machine data and current date.
+        answers (dict | None, optional): Answers to use instead of prompting the user.
     """
     calculate_production_totals(
         meters=files.meter_reads_dump_x,
@@ -93,33 +180,56 @@ def calculate_production(files: FileObj, mor: MOR, CONFIG: ConfigData) -> None:
         data=mor.production_data,
         production_info=CONFIG.production_info,
         today=CONFIG.today,
+        cache=files.source_cache,
+        answers=answers,
     )
 
 
-def calculate_mps(files: FileObj, mor: MOR) -> None:
+def calculate_mps(files: FileObj, mor: MOR, answers: dict | None = None) -> None:
     """
-    Calculates MPS totals and updates the MOR object.
+    Calculates MPS totals and updates the MOR object. MOR_Numbers.xlsx is closed
+    afterwards so it isn't held open during the remaining prompts.
 
     Args:
         files (FileObj): The file objects containing data.
         mor (MOR): The MOR object to be updated.
+        answers (dict | None, optional): Answers to use instead of prompting the user.
     """
-    calculate_mps_totals(mor_numbers=files.mor_numbers_x, data=mor.mps_data)
+    calculate_mps_totals(
+        mor_numbers=files.mor_numbers_x, data=mor.mps_data, answers=answers
+    )
+    files.mor_numbers_x.close()
 
 
-def calculate_mail(mor: MOR) -> None:
+def calculate_mail(mor: MOR, answers: dict | None = None) -> None:
     """
     Calculates mail totals and updates the MOR object.
 
     Args:
         mor (MOR): The MOR object to be updated.
+        answers (dict | None, optional): Answers to use instead of prompting the user.
+    """
+    calculate_mail_totals(data=mor.mail_data, answers=answers)
+
+
+def save_cache(files: FileObj) -> None:
+    """
+    Saves the values read from the data sources if caching is enabled. The cache only
+    saves time on later runs, so failing to write it doesn't end the run.
+
+    Args:
+        files (FileObj): The file objects containing data.
     """
-    calculate_mail_totals(data=mor.mail_data)
+    if files.source_cache:
+        try:
+            files.source_cache.save()
+        except OSError:
+            print(" Unable to save the source file cache.")
 
 
 def write_out(files: FileObj, compiled_totals: dict, CONFIG: ConfigData) -> None:
     """
-    Writes the compiled totals to an output file.
+    Opens the output file for writing and writes the compiled totals to it.
 
     Args:
         files (FileObj): The file objects containing data.
@@ -127,27 +237,103 @@ def write_out(files: FileObj, compiled_totals: dict, CONFIG: ConfigData) -> None
         CONFIG (ConfigData): Configuration data including the formatted date.
     """
     write_output_file(
-        mor_nums=files.mor_numbers_x,
+        mor_nums=reopen_output_file(files),
         data=compiled_totals,
         formatted_date=CONFIG.formatted_date,
+        optional=optional_totals(CONFIG.production_info),
     )
 
 
 def write_log(files: FileObj, compiled_totals: dict, CONFIG: ConfigData) -> None:
     """
-    Writes the compiled totals to a log file if configured to do so.
+    Writes the compiled totals to a log file if configured to do so. The JSON Lines log
+    also records the program version and the hashes of the data source files.
 
     Args:
         files (FileObj): The file objects containing data.
         compiled_totals (dict): The compiled totals to be written.
         CONFIG (ConfigData): Configuration data including the log file path.
     """
-    if CONFIG.write_log_file:
+    if not CONFIG.write_log_file:
+        return
+
+    if CONFIG.log_format != "jsonl":
         output_py(
             data=compiled_totals,
             log_file=files.log_file_p,
             formatted_date=CONFIG.formatted_date,
         )
+        return
+
+    data_sources = (
+        files.meter_reads_dump_x,
+        files.copy_job_counts_x,
+        files.mo_accuracy_x,
+        files.mo_timeliness_x,
+    )
+    sources = [source.path for source in data_sources if source is not None]
+    log_totals(
+        log_file=files.log_file_p,
+        data=compiled_totals,
+        formatted_date=CONFIG.formatted_date,
+        version=__version__,
+        sources=[*sources, files.executive_summary_p],
+        max_bytes=CONFIG.log_max_bytes,
+        backups=CONFIG.log_backups,
+    )
+
+
+def record_history(compiled_totals: dict, CONFIG: ConfigData) -> None:
+    """
+    Adds the compiled totals to the history database if configured to do so. A new
+    database is backfilled from the log files first.
+
+    Args:
+        compiled_totals (dict): The compiled totals to be recorded.
+        CONFIG (ConfigData): Configuration data including the history flag and current date.
+    """
+    if not CONFIG.record_history:
+        return
+
+    history_file = CONFIG.app_files / "MOR_History.sqlite3"
+    backfill = not history_file.is_file()
+    with HistoryStore(history_file) as history:
+        for log_format in ("text", "jsonl"):
+            log_file = log_file_path(CONFIG.app_files, log_format)
+            if backfill and log_file.is_file():
+                history.import_log(log_file)
+        history.record(reporting_month(CONFIG.today), compiled_totals)
+
+
+def report_history(CONFIG: ConfigData, metrics: list[str]) -> None:
+    """
+    Prints each metric's latest month with its year-over-year change and 3 month
+    rolling average from the history database.
+
+    Args:
+        CONFIG (ConfigData): Configuration data including the application files location.
+        metrics (list[str]): The metric names to report. Reports every metric if empty.
+    """
+    history_file = CONFIG.app_files / "MOR_History.sqlite3"
+    if not history_file.is_file():
+        exit(f" No history found in {CONFIG.app_files}.\n Exiting...")
+
+    with HistoryStore(history_file) as history:
+        for metric in metrics or history.metrics():
+            series = history.series(metric)
+            if not series:
+                print(f" {metric}: no history")
+                continue
+            month, value = series[-1]
+            yoy = history.year_over_year(metric, month)
+            _month, average = history.rolling_average(metric, 3, start=month)[0]
+            change = f"{yoy['percent']:+.1f}%" if yoy["percent"] is not None else "n/a"
+            average = f"{average:,.2f}" if average is not None else "n/a"
+            print(
+                f" {metric} ({month}): {value}"
+                f" | year over year: {change}"
+                f" | 3 month average: {average}"
+            )
 
 
 def open_output(files: FileObj, CONFIG: ConfigData) -> None:
@@ -162,21 +348,305 @@ def open_output(files: FileObj, CONFIG: ConfigData) -> None:
         open_file(file_path=files.mor_numbers_x.path)
 
 
-if __name__ == "__main__":
-    CONFIG: ConfigData = get_configuration_data()
+def write_trace(trace: StageTrace | None, CONFIG: ConfigData) -> None:
+    """
+    Writes the stage timings to the JSON trace file, and to the log file if configured to do so.
+
+    Args:
+        trace (StageTrace | None): The stage timings, or None if tracing was disabled.
+        CONFIG (ConfigData): Configuration data including the application files location.
+    """
+    if not trace:
+        return
+    trace.save(CONFIG.app_files / "MOR_Trace.json")
+    if not CONFIG.write_log_file:
+        return
+
+    log_file = log_file_path(CONFIG.app_files, CONFIG.log_format)
+    if CONFIG.log_format == "jsonl":
+        write_log_record(
+            log_file,
+            "trace",
+            {"stages": trace.stages},
+            max_bytes=CONFIG.log_max_bytes,
+            backups=CONFIG.log_backups,
+        )
+    else:
+        output_trace(trace=trace, log_file=log_file)
+
+
+def stage_inputs(
+    files: FileObj, CONFIG: ConfigData, answers: dict | None = None
+) -> dict:
+    """
+    Gets the fingerprints of the inputs of each calculation stage. MPS and mail totals
+    come from the answers (or prompts) only; MOR_Numbers.xlsx isn't an input since the
+    run writes to it.
+
+    Args:
+        files (FileObj): The file objects containing data.
+        CONFIG (ConfigData): Configuration data including the settings each stage uses.
+        answers (dict | None, optional): Answers to use instead of prompting the user.
 
-    display_messages(CONFIG.default_values, CONFIG.app_files)
+    Returns:
+        dict: Stage names and the fingerprints of their inputs.
+    """
+
+    def path(source: object) -> Path | None:
+        return source.path if source is not None else None
+
+    return {
+        "mps": input_fingerprints({}, {"answers": answers}),
+        "production": input_fingerprints(
+            {
+                "meter reads": path(files.meter_reads_dump_x),
+                "accuracy": path(files.mo_accuracy_x),
+                "timeliness": path(files.mo_timeliness_x),
+                "copy jobs": path(files.copy_job_counts_x),
+            },
+            {"answers": answers, "production info": CONFIG.production_info},
+        ),
+        "mail": input_fingerprints({}, {"answers": answers}),
+        "fleet": input_fingerprints(
+            {"executive summary": files.executive_summary_p},
+            {
+                "answers": answers,
+                "regex": [CONFIG.bw_vol_regex, CONFIG.color_vol_regex],
+                "pages": CONFIG.pdf_max_pages,
+                "bbox": CONFIG.pdf_bbox,
+            },
+        ),
+    }
+
+
+def run(
+    CONFIG: ConfigData, answers: dict | None = None, incremental: bool = False
+) -> tuple[FileObj, dict]:
+    """
+    Loads the data sources, calculates all totals and writes the output and log files.
+    Each step is recorded as a stage if tracing is active. The totals and input
+    fingerprints of each stage are saved for the next incremental run.
 
+    Args:
+        CONFIG (ConfigData): Configuration data.
+        answers (dict | None, optional): Answers to use instead of prompting the user.
+        incremental (bool, optional): If True, reuses the previous run's totals for the
+            stages whose inputs haven't changed and only writes the recalculated totals
+            to MOR_Numbers.xlsx. Defaults to False.
+
+    Returns:
+        tuple[FileObj, dict]: The file objects and the compiled totals.
+    """
     mor: MOR = MOR()
-    files: FileObj = get_file_objects(CONFIG.app_files, CONFIG.working_folder)
+    with traced_stage("load_files"):
+        files: FileObj = load_files(CONFIG)
 
-    calculate_fleet(files, mor, CONFIG)
-    calculate_mps(files, mor)
-    calculate_production(files, mor, CONFIG)
-    calculate_mail(mor)
+    state = RunState(
+        CONFIG.app_files / "MOR_State.json", reporting_month(CONFIG.today)
+    )
+    inputs = stage_inputs(files, CONFIG, answers)
+
+    # Fleet totals are gathered last so the background PDF parse started
+    # in get_file_objects overlaps with the prompts
+    stages = {
+        "mps": lambda: calculate_mps(files, mor, answers),
+        "production": lambda: calculate_production(files, mor, CONFIG, answers),
+        "mail": lambda: calculate_mail(mor, answers),
+        "fleet": lambda: calculate_fleet(files, mor, CONFIG, answers),
+    }
+    recalculated = {}
+    for stage, calculate in stages.items():
+        if incremental and state.is_current(stage, inputs[stage]):
+            state.restore(stage, mor)
+            continue
+        with traced_stage(f"calculate_{stage}"):
+            calculate()
+        recalculated[stage] = state.update(stage, inputs[stage], mor)
 
     compiled_totals: dict = compile_totals(mor)
 
-    write_out(files, compiled_totals, CONFIG)
-    write_log(files, compiled_totals, CONFIG)
-    open_output(files, CONFIG)
+    with traced_stage("write_out"):
+        if not incremental:
+            write_out(files, compiled_totals, CONFIG)
+        elif recalculated:
+            print(f" Recalculated: {', '.join(recalculated)}")
+            changed = {
+                key: value
+                for totals in recalculated.values()
+                for key, value in totals.items()
+            }
+            write_out(files, changed, CONFIG)
+        else:
+            print(" No inputs changed since the last run.")
+        state.save()
+    with traced_stage("save_cache"):
+        save_cache(files)
+    with traced_stage("write_log"):
+        write_log(files, compiled_totals, CONFIG)
+    with traced_stage("record_history"):
+        record_history(compiled_totals, CONFIG)
+    return files, compiled_totals
+
+
+def run_batch(
+    CONFIG: ConfigData, answers_file: Path, incremental: bool = False
+) -> dict:
+    """
+    Compiles the MOR without user prompts using an answers file. Any prompt the
+    answers don't cover (missing files, etc.) ends the run instead of waiting.
+
+    Args:
+        CONFIG (ConfigData): Configuration data.
+        answers_file (Path): The path to the JSON answers file.
+        incremental (bool, optional): If True, only recalculates the stages whose
+            inputs changed since the last run. Defaults to False.
+
+    Returns:
+        dict: The compiled totals.
+    """
+    if CONFIG.default_values:
+        exit(f" Update the config.json file in {CONFIG.app_files} first.\n Exiting...")
+
+    answers = load_answers(answers_file)
+    with prompts_disabled():
+        _files, compiled_totals = run(CONFIG, answers, incremental)
+    return compiled_totals
+
+
+def compile_site(site_dir: Path) -> tuple[str, dict | str]:
+    """
+    Compiles the MOR for one site folder without user prompts. The folder holds the
+    site's config.json, answers.json, MOR_Numbers.xlsx and data source files.
+
+    Args:
+        site_dir (Path): The path to the site folder.
+
+    Returns:
+        tuple[str, dict | str]: The site name and its compiled totals, or an error message.
+    """
+    site_dir = Path(site_dir)
+    try:
+        CONFIG = get_configuration_data(app_files=site_dir, working_folder=site_dir)
+        with tracing(CONFIG.trace_stages) as trace:
+            compiled_totals = run_batch(CONFIG, site_dir / "answers.json")
+        write_trace(trace, CONFIG)
+        return site_dir.name, compiled_totals
+    except SystemExit as error:
+        return site_dir.name, " ".join(str(error).split())
+    except Exception as error:
+        return site_dir.name, f"{type(error).__name__}: {error}"
+
+
+def compile_sites(
+    site_dirs: list[Path], summary_path: Path, workers: int | None = None
+) -> dict:
+    """
+    Compiles the MOR for several site folders in parallel (one process per site, up to
+    the number of cores) and writes a summary file with every site's totals.
+
+    Args:
+        site_dirs (list[Path]): The paths to the site folders.
+        summary_path (Path): The path to save the summary file to.
+        workers (int | None, optional): The number of processes to use. Defaults to the number of cores.
+
+    Returns:
+        dict: A dictionary of site names and their compiled totals (or an error message).
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = dict(executor.map(compile_site, site_dirs))
+
+    write_summary_file(summaries=summaries, summary_path=summary_path)
+    for site, totals in summaries.items():
+        print(f" {site}: {'Done' if isinstance(totals, dict) else totals}")
+    return summaries
+
+
+def report_import_times() -> None:
+    """
+    Prints how long the program's own modules took to import, and how long each heavy
+    library takes to import on first use. Libraries imported at startup are flagged
+    since they should only load on first use.
+    """
+    print(f" Program modules: {_IMPORT_TIME:.3f}s")
+    for module_name in _EAGER_IMPORTS:
+        print(f" {module_name}: imported at startup (should load on first use)")
+    for module_name, seconds in time_imports().items():
+        if seconds is not None:
+            print(f" {module_name}: {seconds:.3f}s on first use")
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Compiles MOR info for monthly reports.")
+    parser.add_argument(
+        "--answers",
+        type=Path,
+        help="JSON answers file to compile without user prompts",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only recalculate the totals whose inputs changed since the last run",
+    )
+    parser.add_argument(
+        "--sites",
+        type=Path,
+        nargs="+",
+        help="site folders to compile in parallel without user prompts",
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=Path("MOR_Sites_Summary.xlsx"),
+        help="summary file for --sites (default: MOR_Sites_Summary.xlsx)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="number of processes for --sites (default: cores)"
+    )
+    parser.add_argument(
+        "--history",
+        nargs="*",
+        metavar="METRIC",
+        help="print trends from the history database (all metrics if none given) and exit",
+    )
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        help="print startup import times and exit",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    ARGS = parse_args()
+
+    if ARGS.import_times:
+        report_import_times()
+        exit()
+
+    if ARGS.sites:
+        compile_sites(ARGS.sites, ARGS.summary, ARGS.workers)
+        exit()
+
+    CONFIG: ConfigData = get_configuration_data()
+
+    if ARGS.history is not None:
+        report_history(CONFIG, ARGS.history)
+        exit()
+
+    with tracing(CONFIG.trace_stages) as TRACE:
+        if ARGS.answers:
+            run_batch(CONFIG, ARGS.answers, ARGS.incremental)
+        else:
+            with traced_stage("display_messages"):
+                display_messages(CONFIG.default_values, CONFIG.app_files)
+            files, _compiled_totals = run(CONFIG, incremental=ARGS.incremental)
+            with traced_stage("open_output"):
+                open_output(files, CONFIG)
+    write_trace(TRACE, CONFIG)
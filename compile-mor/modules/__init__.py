@@ -2,23 +2,43 @@
 This module initializes the submodules for the Compile-MOR project.
 
 Submodules:
+- answers: Functions for loading the answers file used without user prompts.
 - display: Functions for displaying ASCII art and welcome messages.
 - fileoutput: Functions for outputting Python code and writing output files.
 - fleetcalc: Functions for calculating fleet totals.
 - getfiles: Functions for retrieving file objects.
+- history: SQLite history of monthly totals with trend queries.
 - loadfile: Functions for loading data source files.
 - mailcalc: Functions for calculating mail totals.
 - mpscalc: Functions for calculating MPS totals.
 - prodcalc: Functions for calculating production totals.
+- runstate: Saved totals and input fingerprints of the previous run for incremental runs.
+- runlog: Structured JSON Lines log of each run with rotation and a streaming reader.
+- sourcecache: Cache of values read from data source files.
 - firstrun: Functions for handling first run messages.
 """
 
+from .answers import load_answers
 from .display import display_ascii_art, display_welcome_message
-from .fileoutput import output_py, write_output_file
+from .fileoutput import (
+    output_py,
+    output_trace,
+    write_output_file,
+    write_summary_file,
+)
 from .fleetcalc import calculate_fleet_totals
-from .getfiles import get_file_objects
+from .getfiles import get_file_objects, reopen_output_file
+from .history import HistoryStore, reporting_month
 from .loadfile import load_data_source_file
 from .mailcalc import calculate_mail_totals
 from .mpscalc import calculate_mps_totals
-from .prodcalc import calculate_production_totals
+from .prodcalc import calculate_production_totals, optional_totals
+from .runlog import (
+    log_file_path,
+    log_totals,
+    read_log_records,
+    write_log_record,
+)
+from .runstate import RunState, input_fingerprints
+from .sourcecache import SourceCache
 from .firstrun import display_first_run_message
@@ -0,0 +1,49 @@
+"""
+This module loads the answers file used to run the program without user prompts.
+"""
+
+import json
+from pathlib import Path
+
+from modules.mailcalc import MAIL_TYPES
+
+REQUIRED_ANSWERS = (
+    "Black and White Waste",
+    "Color Waste",
+    "Equipment Adds",
+    "Equipment Moves",
+    "Beginning Meter Balance",
+    "Postage Added",
+    "Ending Meter Balance",
+    *MAIL_TYPES,
+)
+"""Answers that are always needed."""
+
+FALLBACK_ANSWERS = (
+    "Fleet Black and White",
+    "Fleet Color",
+    "Job Accuracy",
+    "Job Timeliness",
+    "Number of Jobs",
+)
+"""Answers only used when the value can't be read from the data source files."""
+
+
+def load_answers(answers_file: Path) -> dict:
+    """
+    Loads and checks the answers file.
+
+    Args:
+        answers_file (Path): The path to the JSON answers file.
+
+    Returns:
+        dict: The answers, keyed by the same names as the compiled totals.
+    """
+    with open(answers_file, "r", encoding="utf-8") as file:
+        answers = json.load(file)
+
+    missing = [key for key in REQUIRED_ANSWERS if key not in answers]
+    if missing:
+        exit(f" Answers file is missing: {', '.join(missing)}\n Exiting...")
+
+    return answers
@@ -1,11 +1,18 @@
+from __future__ import annotations
+
 from datetime import date
 from pathlib import Path
 from pprint import pformat
+from typing import TYPE_CHECKING
 
-from classes.xlclass import Xlsx
+if TYPE_CHECKING:
+    from classes.xlclass import Xlsx
+    from utils.stagetrace import StageTrace
 
 
-def write_output_file(mor_nums: Xlsx, data: dict, formatted_date: date) -> None:
+def write_output_file(
+    mor_nums: Xlsx, data: dict, formatted_date: date, optional: set | None = None
+) -> None:
     """
     Write data to an Excel file using the Xlsx class.
 
@@ -13,6 +20,7 @@ def write_output_file(mor_nums: Xlsx, data: dict, formatted_date: date) -> None:
     mor_nums (Xlsx): An instance of the Xlsx class.
     data (dict): A dictionary containing the data to be written.
     formatted_date (date): The date to be written in the file.
+    optional (set | None, optional): Totals the output file may not have a row for (ex: color totals of black & white machines). They're written if a row is found, but not reported if not. Defaults to None.
     """
     mor_nums.set_matching_value(
         srchcol="F",
@@ -22,16 +30,79 @@ def write_output_file(mor_nums: Xlsx, data: dict, formatted_date: date) -> None:
         startrow=3,
     )
 
-    for volume_type in data.keys():
-        mor_nums.set_matching_value(
-            srchcol="A",
-            srchval=volume_type,
-            trgtcol="B",
-            setval=data[volume_type],
-            startrow=3,
+    matches = mor_nums.set_matching_values(
+        srchcol="A",
+        mapping=data,
+        trgtcol="B",
+        startrow=3,
+    )
+    _report_matches(matches, optional or set())
+
+    # Only the Data Entry cells set above are rewritten in the file
+    mor_nums.save_values()
+
+
+def _report_matches(matches: dict, optional: set) -> None:
+    """
+    Print any totals that weren't written to exactly one row of the output file.
+
+    Parameters:
+    matches (dict): A dictionary of volume types and the row numbers they were written to.
+    optional (set): Volume types that aren't reported if no row was found.
+    """
+    for volume_type, rows in matches.items():
+        if not rows and volume_type in optional:
+            continue
+        if not rows:
+            print(f" '{volume_type}' not found in output file. Value not written.")
+        elif len(rows) > 1:
+            print(f" '{volume_type}' matched multiple rows {rows}. Value written to all.")
+
+
+def write_summary_file(summaries: dict, summary_path: Path) -> None:
+    """
+    Write the compiled totals for several sites to one Excel file, one column per site.
+
+    Parameters:
+    summaries (dict): A dictionary of site names and their compiled totals (or an error message).
+    summary_path (Path): The path to save the summary file to.
+    """
+    from classes.xlclass import Xlsx
+
+    summary = Xlsx()
+    summary.ws.title = "Summary"
+
+    volume_types = list(
+        dict.fromkeys(
+            volume_type
+            for totals in summaries.values()
+            if isinstance(totals, dict)
+            for volume_type in totals
+        )
+    )
+    summary.ws.append(["Site", *summaries])
+    for volume_type in volume_types:
+        summary.ws.append(
+            [
+                volume_type,
+                *(
+                    totals.get(volume_type) if isinstance(totals, dict) else None
+                    for totals in summaries.values()
+                ),
+            ]
         )
+    summary.ws.append(
+        [
+            "Errors",
+            *(
+                None if isinstance(totals, dict) else str(totals)
+                for totals in summaries.values()
+            ),
+        ]
+    )
 
-    mor_nums.save()
+    summary.set_bold_rows(stoprow=2)
+    summary.save(summary_path)
 
 
 def output_py(data: dict, log_file: Path, formatted_date: date) -> None:
@@ -47,3 +118,16 @@ def output_py(data: dict, log_file: Path, formatted_date: date) -> None:
         file.write(formatted_date)
         file.write(f"\n{pformat(data)}")
         file.write("\n" * 2)
+
+
+def output_trace(trace: StageTrace, log_file: Path) -> None:
+    """
+    Append the stage timings of a run to a log file.
+
+    Parameters:
+    trace (StageTrace): The stage timings of the run.
+    log_file (Path): The path to the log file.
+    """
+    with open(log_file, "a", encoding="utf-8") as file:
+        file.write(trace.format())
+        file.write("\n" * 2)
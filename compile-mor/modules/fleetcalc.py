@@ -1,7 +1,16 @@
+from __future__ import annotations
+
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from modules.sourcecache import SourceCache, cached_extract
+from utils.stagetrace import traced_stage
 
-import pdfplumber
+if TYPE_CHECKING:
+    import pdfplumber
 
 
 def _get_totals_from_user() -> tuple[int, int]:
@@ -21,23 +30,116 @@ def _get_totals_from_user() -> tuple[int, int]:
             print(" Try again. Numbers only.")
 
 
-def _read_text_from_pdf(pdf_path: Path) -> str | None:
+def _read_raw_text(page: pdfplumber.page.Page) -> str:
+    """
+    Join the characters of a page in the order pdfminer parsed them, skipping
+    pdfplumber's layout-aware line clustering (the page itself is still fully parsed
+    by pdfminer). Gaps between text runs and line changes become spaces.
+
+    Args:
+        page (pdfplumber.page.Page): The (optionally cropped) page to read.
+
+    Returns:
+        str: The raw text of the page.
+    """
+    text = []
+    last_char = None
+    for char in page.chars:
+        if last_char and (
+            abs(char["top"] - last_char["top"]) > 1
+            or char["x0"] - last_char["x1"] > char["size"] / 5
+        ):
+            text.append(" ")
+        text.append(char["text"])
+        last_char = char
+    return "".join(text)
+
+
+def _crop_to_page(page: pdfplumber.page.Page, bbox: list) -> pdfplumber.page.Page:
+    """
+    Crop a page to the part of the bounding box that lies within it, so a box set for
+    another paper size (ex: Letter instead of A4) doesn't raise an error.
+
+    Args:
+        page (pdfplumber.page.Page): The page to crop.
+        bbox (list): The (x0, top, x1, bottom) area to read.
+
+    Returns:
+        pdfplumber.page.Page: The cropped page, or the whole page if the bounding box
+        is outside of it.
     """
-    Extract text from the first page of a PDF file.
+    x0, top, x1, bottom = page.bbox
+    clamped = (
+        max(bbox[0], x0),
+        max(bbox[1], top),
+        min(bbox[2], x1),
+        min(bbox[3], bottom),
+    )
+    if clamped[0] >= clamped[2] or clamped[1] >= clamped[3]:
+        return page
+    return page.crop(clamped)
+
+
+def _read_text_from_pdf(
+    pdf_path: Path,
+    bw_regex: str | None = None,
+    color_regex: str | None = None,
+    max_pages: int = 1,
+    bbox: list | None = None,
+) -> str | None:
+    """
+    Extract raw text from the pages of a PDF file, stopping as soon as both volume
+    regular expressions have matched the text read so far.
 
     Args:
         pdf_path (Path): The path to the PDF file.
+        bw_regex (str | None, optional): The regular expression pattern for black & white volume.
+        color_regex (str | None, optional): The regular expression pattern for color volume.
+        max_pages (int, optional): The number of pages to read before giving up. Defaults to 1.
+        bbox (list | None, optional): The (x0, top, x1, bottom) area of each page to read,
+            clamped to the page. Reads the whole page if None (or if the area is outside
+            the page). Defaults to None.
 
     Returns:
-        str | None: The extracted text from the first page of the PDF, or None if an error occurs.
+        str | None: The extracted text from the pages read, or None if an error occurs.
     """
+    import pdfplumber
+
+    patterns = [re.compile(regex) for regex in (bw_regex, color_regex) if regex]
+    page_texts = []
+    stage = traced_stage(f"read {Path(pdf_path).name}")
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            page1 = pdf.pages[0]
-            return page1.extract_text()
+        with stage, pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages[:max_pages]:
+                if bbox:
+                    page = _crop_to_page(page, bbox)
+                page_texts.append(_read_raw_text(page))
+                text = "\n".join(page_texts)
+                if patterns and all(pattern.search(text) for pattern in patterns):
+                    break
     except IOError:
         print(" Unable to get info from Executive Summary PDF...")
         return None
+    return "\n".join(page_texts)
+
+
+def read_pdf_in_background(pdf_path: Path, **options) -> Future:
+    """
+    Start extracting text from the PDF on a background thread so the parse
+    overlaps with loading the other files and the user prompts.
+
+    Args:
+        pdf_path (Path): The path to the PDF file.
+        **options: Keyword arguments passed to _read_text_from_pdf
+            (bw_regex, color_regex, max_pages, bbox).
+
+    Returns:
+        Future: A future resolving to the extracted text, or None if an error occurs.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    page_text = executor.submit(_read_text_from_pdf, pdf_path, **options)
+    executor.shutdown(wait=False)
+    return page_text
 
 
 def _get_volumes_from_text(
@@ -61,13 +163,65 @@ def _get_volumes_from_text(
         color_volume = comp_color_regex.search(page_text).group(2).replace(",", "")
         bw_volume = int(bw_volume)
         color_volume = int(color_volume)
-    except ValueError:
+    except (AttributeError, ValueError):
         bw_volume, color_volume = 0, 0
     return bw_volume, color_volume
 
 
+def _read_volumes_from_pdf(
+    exec_summary: Path,
+    bw_vol_regex: str,
+    color_vol_regex: str,
+    page_text: Future | None = None,
+    max_pages: int = 1,
+    bbox: list | None = None,
+) -> list[int, int]:
+    """
+    Read the black & white and color volumes from the executive summary PDF.
+
+    Args:
+        exec_summary (Path): The path to the executive summary PDF.
+        bw_vol_regex (str): The regular expression pattern for black & white volume.
+        color_vol_regex (str): The regular expression pattern for color volume.
+        page_text (Future | None, optional): Text extraction already started with
+            read_pdf_in_background. Reads the PDF now if None. Defaults to None.
+        max_pages (int, optional): The number of pages to search for the volumes. Defaults to 1.
+        bbox (list | None, optional): The (x0, top, x1, bottom) area of each page to read.
+            Defaults to None.
+
+    Returns:
+        list[int, int]: A list containing the black & white volume and color volume.
+    """
+    if page_text:
+        page_text = page_text.result()
+    else:
+        page_text = _read_text_from_pdf(
+            exec_summary,
+            bw_regex=bw_vol_regex,
+            color_regex=color_vol_regex,
+            max_pages=max_pages,
+            bbox=bbox,
+        )
+
+    if not page_text:
+        return 0, 0
+    return _get_volumes_from_text(
+        page_text=page_text,
+        bw_regex=bw_vol_regex,
+        color_regex=color_vol_regex,
+    )
+
+
 def calculate_fleet_totals(
-    exec_summary: Path, data: dict, bw_vol_regex: str, color_vol_regex: str
+    exec_summary: Path,
+    data: dict,
+    bw_vol_regex: str,
+    color_vol_regex: str,
+    page_text: Future | None = None,
+    max_pages: int = 1,
+    bbox: list | None = None,
+    cache: SourceCache | None = None,
+    answers: dict | None = None,
 ) -> None:
     """
     Calculate and update the total volumes for fleet usage.
@@ -77,23 +231,37 @@ def calculate_fleet_totals(
         data (dict): The dictionary to update with the fleet totals.
         bw_vol_regex (str): The regular expression pattern for black & white volume.
         color_vol_regex (str): The regular expression pattern for color volume.
+        page_text (Future | None, optional): Text extraction already started with
+            read_pdf_in_background. Reads the PDF now if None. Defaults to None.
+        max_pages (int, optional): The number of pages to search for the volumes. Defaults to 1.
+        bbox (list | None, optional): The (x0, top, x1, bottom) area of each page to read.
+            Defaults to None.
+        cache (SourceCache | None, optional): Cache of values read from the PDF. Defaults to None.
+        answers (dict | None, optional): Answers with fallback totals to use instead of
+            prompting the user if the PDF can't be read. Defaults to None.
     """
     print(' Gathering Fleet totals from "Executive summary.pdf"...', end="")
 
-    bw_volume: int = 0
-    color_volume: int = 0
-
-    page_text = _read_text_from_pdf(exec_summary)
-
-    if page_text:
-        bw_volume, color_volume = _get_volumes_from_text(
+    bw_volume, color_volume = cached_extract(
+        cache=cache,
+        source=exec_summary,
+        key=f"fleet volumes {bw_vol_regex} {color_vol_regex} {max_pages} {bbox}",
+        extract=partial(
+            _read_volumes_from_pdf,
+            bw_vol_regex=bw_vol_regex,
+            color_vol_regex=color_vol_regex,
             page_text=page_text,
-            bw_regex=bw_vol_regex,
-            color_regex=color_vol_regex,
-        )
+            max_pages=max_pages,
+            bbox=bbox,
+        ),
+    )
 
     if not any([bw_volume, color_volume]):
-        bw_volume, color_volume = _get_totals_from_user()
+        if answers and "Fleet Black and White" in answers and "Fleet Color" in answers:
+            bw_volume = answers["Fleet Black and White"]
+            color_volume = answers["Fleet Color"]
+        else:
+            bw_volume, color_volume = _get_totals_from_user()
 
     data["Fleet Black and White"] = bw_volume
     data["Fleet Color"] = color_volume
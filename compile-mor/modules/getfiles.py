@@ -1,41 +1,213 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from classes.dclasses import FileObj
-from modules.loadfile import load_data_source_file
+from modules.fleetcalc import read_pdf_in_background
+from modules.loadfile import (
+    find_data_source_file,
+    load_data_source_file,
+    read_data_source_rows,
+)
+from modules.runlog import log_file_path
+from modules.sourcecache import CachedFile, SourceCache
 from utils.pathchecker import check_paths
+from utils.stagetrace import traced_stage
+
+if TYPE_CHECKING:
+    from classes.xlclass import Xlsx
 
 
-def get_file_objects(app_files: Path, working_folder: Path) -> FileObj:
+def _get_data_sources(app_files: Path, working_folder: Path) -> dict:
     """
-    Generates and returns file access objects.
+    Generates the load settings for each Excel data source.
 
     Args:
         app_files (Path): The path to the application files.
         working_folder (Path): The path to the working folder.
 
     Returns:
-        FileObj: An object containing file paths and loaded data sources.
+        dict: A dictionary of FileObj attribute names and load_data_source_file arguments.
     """
-    check_paths(app_files / "MOR_Numbers.xlsx")
-
-    return FileObj(
-        mor_numbers_x=load_data_source_file(
+    return {
+        # Only peeked at here; reopened writable when the totals are written
+        "mor_numbers_x": dict(
             filepath=app_files / "MOR_Numbers.xlsx",
             sheet_name="Data Entry",
             required=True,
+            read_only=True,
         ),
-        executive_summary_p=working_folder / "Executive summary.pdf",
-        meter_reads_dump_x=load_data_source_file(
-            filepath=working_folder / "Meter_Reads_Data_Dump.xlsx", required=True
+        "meter_reads_dump_x": dict(
+            filepath=working_folder / "Meter_Reads_Data_Dump.xlsx",
+            required=True,
+            read_only=True,
         ),
-        copy_job_counts_x=load_data_source_file(
-            working_folder / "Copy_Job_Counts_by_Product_Type.xlsx"
+        "copy_job_counts_x": dict(
+            filepath=working_folder / "Copy_Job_Counts_by_Product_Type.xlsx",
+            read_only=True,
         ),
-        mo_accuracy_x=load_data_source_file(
-            working_folder / "Monthly_Management_Accuracy.xlsx"
+        "mo_accuracy_x": dict(
+            filepath=working_folder / "Monthly_Management_Accuracy.xlsx",
+            read_only=True,
         ),
-        mo_timeliness_x=load_data_source_file(
-            working_folder / "Monthly_Management_Timeliness.xlsx"
+        "mo_timeliness_x": dict(
+            filepath=working_folder / "Monthly_Management_Timeliness.xlsx",
+            read_only=True,
         ),
-        log_file_p=app_files / "MOR_Log.txt",
+    }
+
+
+def reopen_output_file(files: FileObj) -> Xlsx:
+    """
+    Closes the read-only MOR_Numbers.xlsx opened by get_file_objects and opens it
+    writable, so the full workbook is only loaded when the totals are written.
+
+    Args:
+        files (FileObj): The file objects containing data.
+
+    Returns:
+        Xlsx: The writable Xlsx object (also set on files.mor_numbers_x).
+    """
+    peek = files.mor_numbers_x
+    if not peek.read_only:
+        return peek
+    peek.close()
+    files.mor_numbers_x = load_data_source_file(
+        filepath=peek.path, sheet_name="Data Entry", required=True
+    )
+    return files.mor_numbers_x
+
+
+def _load_data_sources_parallel(sources: dict, input_only: set) -> dict:
+    """
+    Loads the data sources, reading the input-only *.xlsx files in worker processes
+    while the other files load on the main process. Sheets are selected (asking the
+    user if a workbook has several) before any worker starts, and the workers return
+    the sheet's row values, which are wrapped in read-only Xlsx objects.
+
+    Args:
+        sources (dict): A dictionary of FileObj attribute names and load_data_source_file arguments.
+        input_only (set): The FileObj attribute names of the input-only data sources.
+
+    Returns:
+        dict: A dictionary of FileObj attribute names and loaded data sources.
+    """
+    from classes.xlclass import Xlsx
+    from classes.xlclass.sheetpatch import sheet_names
+    from classes.xlclass.utils import select_sheet
+
+    parallel = {
+        name: settings
+        for name, settings in sources.items()
+        if name in input_only and settings["filepath"].suffix == ".xlsx"
+    }
+    for settings in parallel.values():
+        settings["sheet_name"] = settings.get("sheet_name") or select_sheet(
+            sheet_names(settings["filepath"])
+        )
+
+    loaded = {}
+    workers = min(len(parallel), os.cpu_count() or 1) or 1
+    with traced_stage("load data sources in parallel"):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                name: executor.submit(
+                    read_data_source_rows, settings["filepath"], settings["sheet_name"]
+                )
+                for name, settings in parallel.items()
+            }
+            for name, settings in sources.items():
+                if name not in parallel:
+                    loaded[name] = load_data_source_file(**settings)
+
+            for name, future in futures.items():
+                settings = parallel[name]
+                loaded[name] = Xlsx.from_rows(
+                    future.result(), settings["filepath"], settings["sheet_name"]
+                )
+
+    return loaded
+
+
+def get_file_objects(
+    app_files: Path,
+    working_folder: Path,
+    parallel: bool = False,
+    pdf_options: dict | None = None,
+    cache: SourceCache | None = None,
+    log_format: str = "jsonl",
+) -> FileObj:
+    """
+    Generates and returns file access objects. Input-only data sources are
+    opened read-only so they are streamed instead of loaded as full workbooks.
+    MOR_Numbers.xlsx is also opened read-only for the previous month's values
+    (see reopen_output_file).
+    Text extraction of the executive summary PDF starts in the background
+    before the workbooks are loaded. Input-only files with values in the cache
+    aren't loaded at all (see CachedFile).
+
+    Args:
+        app_files (Path): The path to the application files.
+        working_folder (Path): The path to the working folder.
+        parallel (bool, optional): If True, reads the input-only *.xlsx files in
+            worker processes (see _load_data_sources_parallel). Defaults to False.
+        pdf_options (dict | None, optional): Text extraction options passed to
+            read_pdf_in_background. Defaults to None.
+        cache (SourceCache | None, optional): Cache of values read from earlier
+            versions of the files. Defaults to None.
+        log_format (str, optional): Format of the log file, "jsonl" or "text".
+            Defaults to "jsonl".
+
+    Returns:
+        FileObj: An object containing file paths and loaded data sources.
+    """
+    check_paths(app_files / "MOR_Numbers.xlsx")
+
+    executive_summary = working_folder / "Executive summary.pdf"
+    executive_summary_text = None
+    if not (cache and executive_summary.is_file() and cache.has(executive_summary)):
+        executive_summary_text = read_pdf_in_background(
+            executive_summary, **(pdf_options or {})
+        )
+
+    # Ask for missing files before loading anything
+    loaded, sources, input_only_names = {}, {}, set()
+    for name, settings in _get_data_sources(app_files, working_folder).items():
+        # MOR_Numbers.xlsx is written to later, so it's never an .xls or cached file
+        input_only = settings.get("read_only", False) and name != "mor_numbers_x"
+        # Legacy .xls and .csv exports are only accepted for input-only files
+        settings["filepath"] = find_data_source_file(
+            settings["filepath"],
+            required=settings.get("required", False),
+            allow_xls=input_only,
+            allow_csv=input_only,
+        )
+        if not settings["filepath"]:
+            loaded[name] = None
+        elif cache and input_only and cache.has(settings["filepath"]):
+            loaded[name] = CachedFile(path=settings["filepath"], settings=settings)
+        else:
+            sources[name] = settings
+            if input_only:
+                input_only_names.add(name)
+
+    if parallel:
+        loaded.update(_load_data_sources_parallel(sources, input_only_names))
+    else:
+        loaded.update(
+            {
+                name: load_data_source_file(**settings)
+                for name, settings in sources.items()
+            }
+        )
+
+    return FileObj(
+        **loaded,
+        executive_summary_p=executive_summary,
+        log_file_p=log_file_path(app_files, log_format),
+        executive_summary_text=executive_summary_text,
+        source_cache=cache,
     )
@@ -0,0 +1,262 @@
+"""
+This module provides a SQLite history of the compiled monthly totals, one row per
+reporting month per metric, with helpers for year-over-year comparisons and rolling
+averages.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+from modules.runlog import read_log_records
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS totals (
+    month TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    recorded TEXT NOT NULL,
+    PRIMARY KEY (month, metric)
+)
+"""
+
+
+def reporting_month(today: date) -> str:
+    """
+    Get the reporting month (the month before the current date).
+
+    Args:
+        today (date): The current date.
+
+    Returns:
+        str: The reporting month as "YYYY-MM".
+    """
+    if today.month == 1:
+        return f"{today.year - 1}-12"
+    return f"{today.year}-{today.month - 1:02d}"
+
+
+def _shift_month(month: str, months: int) -> str:
+    """
+    Move a "YYYY-MM" month forwards (or backwards) by a number of months.
+
+    Args:
+        month (str): The month as "YYYY-MM".
+        months (int): The number of months to move (negative to move back).
+
+    Returns:
+        str: The shifted month as "YYYY-MM".
+    """
+    year, month = map(int, month.split("-"))
+    index = year * 12 + month - 1 + months
+    return f"{index // 12}-{index % 12 + 1:02d}"
+
+
+def _to_number(value: object) -> float | None:
+    """
+    Convert a total to a number, or None for non-numeric totals ("Not Found", etc).
+
+    Args:
+        value (object): The total.
+
+    Returns:
+        float | None: The numeric value, or None.
+    """
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class HistoryStore:
+    """
+    SQLite store of compiled totals by reporting month and metric. Recording a month
+    again replaces its earlier values.
+    """
+
+    def __init__(self, db_file: Path) -> None:
+        """
+        Opens (or creates) the history database.
+
+        Args:
+            db_file (Path): The path to the SQLite database file.
+        """
+        self.db_file = Path(db_file)
+        self.connection = sqlite3.connect(self.db_file)
+        self.connection.execute(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    def __enter__(self) -> HistoryStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def record(self, month: str, totals: dict) -> None:
+        """
+        Stores the totals for a reporting month. Non-numeric totals are stored as NULL.
+
+        Args:
+            month (str): The reporting month as "YYYY-MM".
+            totals (dict): A dictionary of metric names and totals (see compile_totals).
+        """
+        recorded = datetime.now().isoformat(timespec="seconds")
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO totals (month, metric, value, recorded)"
+                " VALUES (?, ?, ?, ?)",
+                [
+                    (month, metric, _to_number(value), recorded)
+                    for metric, value in totals.items()
+                ],
+            )
+
+    def metrics(self) -> list[str]:
+        """
+        Lists the metrics in the history.
+
+        Returns:
+            list[str]: The metric names, sorted.
+        """
+        return [
+            metric
+            for (metric,) in self.connection.execute(
+                "SELECT DISTINCT metric FROM totals ORDER BY metric"
+            )
+        ]
+
+    def series(
+        self, metric: str, start: str | None = None, end: str | None = None
+    ) -> list[tuple[str, float | None]]:
+        """
+        Gets the monthly values of a metric.
+
+        Args:
+            metric (str): The metric name. ex: "Fleet Color"
+            start (str | None, optional): The first month ("YYYY-MM"). Defaults to None.
+            end (str | None, optional): The last month ("YYYY-MM"). Defaults to None.
+
+        Returns:
+            list[tuple[str, float | None]]: (month, value) pairs, oldest first.
+        """
+        return self.connection.execute(
+            "SELECT month, value FROM totals WHERE metric = ?"
+            " AND month >= ? AND month <= ? ORDER BY month",
+            (metric, start or "0000-00", end or "9999-99"),
+        ).fetchall()
+
+    def value(self, metric: str, month: str) -> float | None:
+        """
+        Gets the value of a metric for one month.
+
+        Args:
+            metric (str): The metric name.
+            month (str): The month as "YYYY-MM".
+
+        Returns:
+            float | None: The value, or None if it isn't recorded (or wasn't numeric).
+        """
+        row = self.connection.execute(
+            "SELECT value FROM totals WHERE metric = ? AND month = ?", (metric, month)
+        ).fetchone()
+        return row[0] if row else None
+
+    def year_over_year(self, metric: str, month: str) -> dict:
+        """
+        Compares a metric for a month with the same month of the previous year.
+
+        Args:
+            metric (str): The metric name.
+            month (str): The month as "YYYY-MM".
+
+        Returns:
+            dict: The "current" and "previous" values, the "change" between them and the
+            "percent" change. Values that can't be calculated are None.
+        """
+        current = self.value(metric, month)
+        previous = self.value(metric, _shift_month(month, -12))
+        change = percent = None
+        if current is not None and previous is not None:
+            change = current - previous
+            percent = change / previous * 100 if previous else None
+        return {
+            "current": current,
+            "previous": previous,
+            "change": change,
+            "percent": percent,
+        }
+
+    def rolling_average(
+        self, metric: str, months: int = 3, start: str | None = None, end: str | None = None
+    ) -> list[tuple[str, float | None]]:
+        """
+        Gets the rolling average of a metric over the calendar months ending at each
+        recorded month. Months missing from the history aren't averaged, so a gap never
+        stretches the window back past the number of months.
+
+        Args:
+            metric (str): The metric name.
+            months (int, optional): The number of calendar months to average. Defaults to 3.
+            start (str | None, optional): The first month to return ("YYYY-MM"). Defaults to None.
+            end (str | None, optional): The last month to return ("YYYY-MM"). Defaults to None.
+
+        Returns:
+            list[tuple[str, float | None]]: (month, average) pairs, oldest first.
+        """
+        return self.connection.execute(
+            "SELECT month, average FROM ("
+            " SELECT month, AVG(value) OVER ("
+            "  ORDER BY CAST(substr(month, 1, 4) AS INTEGER) * 12"
+            "  + CAST(substr(month, 6, 2) AS INTEGER)"
+            "  RANGE BETWEEN ? PRECEDING AND CURRENT ROW"
+            " ) AS average FROM totals WHERE metric = ?"
+            ") WHERE month >= ? AND month <= ? ORDER BY month",
+            (months - 1, metric, start or "0000-00", end or "9999-99"),
+        ).fetchall()
+
+    def import_log(self, log_file: Path) -> int:
+        """
+        Backfills the history from the entries of a MOR_Log.txt file (a compile date line
+        followed by the totals dictionary) or the totals records of a MOR_Log.jsonl file
+        and its backups. Months already in the history are replaced.
+
+        Args:
+            log_file (Path): The path to the log file.
+
+        Returns:
+            int: The number of entries imported.
+        """
+        if Path(log_file).suffix == ".jsonl":
+            imported = 0
+            for record in read_log_records(log_file):
+                compiled = date.fromisoformat(record["timestamp"][:10])
+                self.record(reporting_month(compiled), record.get("totals", {}))
+                imported += 1
+            return imported
+
+        text = Path(log_file).read_text(encoding="utf-8")
+        entries = re.finditer(
+            r"^(\d{1,2})/(\d{1,2})/(\d{4})\n(\{.*?\})\n", text, re.MULTILINE | re.DOTALL
+        )
+
+        imported = 0
+        for entry in entries:
+            month, day, year, totals = entry.groups()
+            try:
+                totals = ast.literal_eval(totals)
+            except (SyntaxError, ValueError):
+                continue
+            self.record(reporting_month(date(int(year), int(month), int(day))), totals)
+            imported += 1
+        return imported
@@ -1,11 +1,44 @@
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from classes.xlclass import Xlsx
 from utils.dropfile import get_dropped_file
+from utils.stagetrace import traced_stage
+
+if TYPE_CHECKING:
+    from classes.xlclass import Xlsx
+
+
+def find_data_source_file(
+    filepath: Path, required=False, allow_xls=False, allow_csv=False
+) -> Path | None:
+    """
+    Locate a data source file, asking for it if it's required and missing.
+
+    Parameters:
+    filepath (Path): The path to the Excel file.
+    required (bool, optional): If True, prompts the user to drop a file if the specified file is not found. Defaults to False.
+    allow_xls (bool, optional): If True, uses a legacy .xls file with the same name if the .xlsx file is missing. Defaults to False.
+    allow_csv (bool, optional): If True, uses a .csv export with the same name if the .xlsx (and .xls) file is missing. Defaults to False.
+
+    Returns:
+    Path | None: The path to the file if found, otherwise None.
+    """
+    if not filepath.is_file():
+        for allowed, suffix in ((allow_xls, ".xls"), (allow_csv, ".csv")):
+            if allowed and filepath.with_suffix(suffix).is_file():
+                return filepath.with_suffix(suffix)
+    if not filepath.is_file():
+        if required:
+            print(f"\n {filepath.name} file not found in Downloads folder.")
+            return get_dropped_file()
+        return None
+    return filepath
 
 
 def load_data_source_file(
-    filepath: Path, sheet_name: str = False, required=False
+    filepath: Path, sheet_name: str = False, required=False, read_only=False
 ) -> Xlsx | None:
     """
     Load data from an Excel file.
@@ -14,16 +47,38 @@ def load_data_source_file(
     filepath (Path): The path to the Excel file.
     sheet_name (str, optional): The name of the sheet to load. Defaults to False.
     required (bool, optional): If True, prompts the user to drop a file if the specified file is not found. Defaults to False.
+    read_only (bool, optional): If True, opens the file in streaming read-only, values-only mode. Defaults to False.
 
     Returns:
     Xlsx | None: An Xlsx object if the file is found, otherwise None.
     """
-    if not filepath.is_file():
-        if required:
-            print(f"\n {filepath.name} file not found in Downloads folder.")
-            filepath = get_dropped_file()
-        else:
-            return None
-    if sheet_name:
-        return Xlsx(filepath, sheet_name)
-    return Xlsx(filepath)
+    from classes.xlclass import Xlsx
+
+    filepath = find_data_source_file(filepath, required)
+    if not filepath:
+        return None
+    with traced_stage(f"load {filepath.name}"):
+        if sheet_name:
+            return Xlsx(filepath, sheet_name, read_only=read_only)
+        return Xlsx(filepath, read_only=read_only)
+
+
+def read_data_source_rows(filepath: Path, sheet_name: str) -> list[tuple]:
+    """
+    Read every row of a data source sheet. Runs in a worker process when the data
+    sources are loaded in parallel, so only plain values are returned.
+
+    Parameters:
+    filepath (Path): The path to the *.xlsx file.
+    sheet_name (str): The name of the sheet to read.
+
+    Returns:
+    list[tuple]: The values of each row, first row first.
+    """
+    from classes.xlclass import Xlsx
+
+    xlsx = Xlsx(filepath, sheet_name, read_only=True)
+    try:
+        return list(xlsx.ws.iter_rows(values_only=True))
+    finally:
+        xlsx.close()
@@ -58,27 +58,56 @@ def _calculate_postage(data: dict) -> None:
     data["Postage Spend"] = meter_start + postage_added - meter_end
 
 
+MAIL_TYPES = (
+    "Outbound Mail",
+    "Inbound Mail",
+    "Returned Mail",
+    "Outbound Accountable Mail",
+    "Inbound Accountable Mail",
+)
+"""Mail volume types entered each month."""
+
+
 def _get_mail_volumes_input(data: dict):
     """
     Prompts the user to enter daily totals for various mail types.
     Updates the data dictionary with the total volumes.
     """
     print("\n *Mail Volumes*")
-    for mail_type in (
-        "Outbound Mail",
-        "Inbound Mail",
-        "Returned Mail",
-        "Outbound Accountable Mail",
-        "Inbound Accountable Mail",
-    ):
+    for mail_type in MAIL_TYPES:
         print(f"\n Enter each day's total from the {mail_type} column.")
         data[mail_type] = 0
         data[mail_type] = _add_loop()
 
 
-def calculate_mail_totals(data: dict) -> None:
+def _total(answer: int | float | list) -> int | float:
+    """
+    Returns the answer as a single total, adding up the entries if it's a list.
+    """
+    return sum(answer) if isinstance(answer, list) else answer
+
+
+def _apply_answers(data: dict, answers: dict) -> None:
+    """
+    Updates the data dictionary from an answers file instead of prompting the user.
+    Postage added and mail volumes can be single totals or lists of entries.
+    """
+    data["Postage Spend"] = (
+        answers["Beginning Meter Balance"]
+        + _total(answers["Postage Added"])
+        - answers["Ending Meter Balance"]
+    )
+    for mail_type in MAIL_TYPES:
+        data[mail_type] = _total(answers[mail_type])
+
+
+def calculate_mail_totals(data: dict, answers: dict | None = None) -> None:
     """
-    Calculates and updates the total volumes for mail usage.
+    Calculates and updates the total volumes for mail usage. Uses the answers
+    dictionary instead of prompting the user if one is passed.
     """
+    if answers is not None:
+        _apply_answers(data, answers)
+        return
     _calculate_postage(data)
     _get_mail_volumes_input(data)
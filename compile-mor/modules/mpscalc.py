@@ -1,4 +1,9 @@
-from classes.xlclass import Xlsx
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from classes.xlclass import Xlsx
 
 
 def _read_mps_from_output_file(mor_numbers: Xlsx, data: dict) -> None:
@@ -69,13 +74,24 @@ def _check_for_updates(data: dict) -> None:
         data["Equipment Moves"] += _ask_for_new_numbers("moves")
 
 
-def calculate_mps_totals(mor_numbers: Xlsx, data: dict):
+def _apply_answers(data: dict, answers: dict) -> None:
+    """Updates equipment adds and moves from an answers file instead of prompting the user."""
+    data["Equipment Adds"] += answers["Equipment Adds"]
+    data["Number of Ricoh Devices"] += answers["Equipment Adds"]
+    data["Equipment Moves"] += answers["Equipment Moves"]
+
+
+def calculate_mps_totals(mor_numbers: Xlsx, data: dict, answers: dict | None = None):
     """Calculates and updates the MPS totals.
 
     Args:
         mor_numbers (Xlsx): An instance of the Xlsx class containing the MPS data.
         data (dict): A dictionary to store the MPS totals.
+        answers (dict | None, optional): Answers to use instead of prompting the user. Defaults to None.
     """
     _read_mps_from_output_file(mor_numbers=mor_numbers, data=data)
     _set_zero_starts(data=data)
-    _check_for_updates(data=data)
+    if answers is not None:
+        _apply_answers(data=data, answers=answers)
+    else:
+        _check_for_updates(data=data)
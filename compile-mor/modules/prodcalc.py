@@ -1,10 +1,77 @@
+from __future__ import annotations
+
 import calendar
+import json
 from datetime import date
+from functools import partial
+from typing import TYPE_CHECKING
+
+from modules.sourcecache import SourceCache, cached_extract
+
+if TYPE_CHECKING:
+    from classes.xlclass import Xlsx
+
+
+def _get_production_volumes(meters: Xlsx, production_info: dict) -> dict:
+    """
+    Read the production totals for each machine from the meter reads data dump.
+
+    Args:
+        meters (Xlsx): The Xlsx object containing meter data.
+        production_info (dict): The dictionary containing machine data and meter columns.
+
+    Returns:
+        dict: A dictionary of "[machine name] [meter type]" keys and totals.
+    """
+    meter_columns = production_info["meter columns"]
+    machines = {
+        info["name"]: info["serial number"]
+        for entry, info in production_info.items()
+        if "machine" in entry
+    }
+    total_columns = {
+        cell_contents: column
+        for cell_contents, column in meter_columns.items()
+        if "total" in cell_contents
+    }
+
+    volumes = meters.get_matching_values(
+        srchcol=meter_columns["serials"],
+        srchvals=list(machines.values()),
+        retcols=list(total_columns.values()),
+        startrow=5,
+    )
 
-from classes.xlclass import Xlsx
+    return {
+        f"{name} {cell_contents}": volumes[serial_number][column]
+        for name, serial_number in machines.items()
+        for cell_contents, column in total_columns.items()
+    }
 
 
-def _read_production_volumes(meters: Xlsx, data: dict, production_info: dict) -> None:
+def optional_totals(production_info: dict) -> set[str]:
+    """
+    Get the production totals the output file doesn't need a row for: the color
+    totals of the black & white machines, which are always zero.
+
+    Args:
+        production_info (dict): The production machine and meter column settings.
+
+    Returns:
+        set[str]: The names of the optional totals. ex: {"BW1 total color"}
+    """
+    return {
+        f"{info['name']} {cell_contents}"
+        for entry, info in production_info.items()
+        if entry.startswith("bw machine")
+        for cell_contents in production_info["meter columns"]
+        if "total" in cell_contents and "color" in cell_contents
+    }
+
+
+def _read_production_volumes(
+    meters: Xlsx, data: dict, production_info: dict, cache: SourceCache | None = None
+) -> None:
     """
     Gather production totals from the meter reads data dump.
 
@@ -12,21 +79,18 @@ def _read_production_volumes(meters: Xlsx, data: dict, production_info: dict) ->
         meters (Xlsx): The Xlsx object containing meter data.
         data (dict): The dictionary to store production volumes.
         production_info (dict): The dictionary containing machine data and meter columns.
+        cache (SourceCache | None, optional): Cache of values read from the file. Defaults to None.
     """
     print(" Gathering Production totals from", "Meter_Reads_Data_Dump.xlsx...", end="")
 
-    for entry, info in production_info.items():
-        if "machine" not in entry:
-            continue
-        for cell_contents, column in production_info["meter columns"].items():
-            if "total" not in cell_contents:
-                continue
-            data[f'{info["name"]} {cell_contents}'] = meters.get_matching_value(
-                srchcol=production_info["meter columns"]["serials"],
-                srchval=info["serial number"],
-                retcol=column,
-                startrow=5,
-            )
+    data.update(
+        cached_extract(
+            cache=cache,
+            source=meters,
+            key=f"production volumes {json.dumps(production_info, sort_keys=True)}",
+            extract=partial(_get_production_volumes, production_info=production_info),
+        )
+    )
 
     print("Done.")
 
@@ -55,18 +119,23 @@ def _get_waste_input_from_user(disp: str) -> int:
         print(" Please try again...")
 
 
-def _get_waste_totals(data: dict) -> None:
+def _get_waste_totals(data: dict, answers: dict | None = None) -> None:
     """
-    Get waste totals from the user.
+    Get waste totals from the user, or from the answers dictionary if one is passed.
 
     Args:
         data (dict): The dictionary to store waste totals.
+        answers (dict | None, optional): Answers to use instead of prompting the user. Defaults to None.
     """
     for key, display in (
         ("Black and White Waste", "Black and White"),
         ("Color Waste", "Color"),
     ):
-        data[key] = _get_waste_input_from_user(disp=display)
+        data[key] = (
+            -abs(int(answers[key]))
+            if answers is not None
+            else _get_waste_input_from_user(disp=display)
+        )
 
 
 def _get_reporting_month_year(today: date) -> str:
@@ -81,11 +150,15 @@ def _get_reporting_month_year(today: date) -> str:
     """
     month = today.month - 1 if today.month != 1 else 12
     year = today.year if month != 12 else today.year - 1
-    return calendar.month_name[month], str(year) + ".0"
+    return calendar.month_name[month], str(year)
 
 
 def _read_stats_file(
-    acc_time: Xlsx, report_mo: str, report_yr: str, disp: str
+    acc_time: Xlsx,
+    report_mo: str,
+    report_yr: str,
+    disp: str,
+    cache: SourceCache | None = None,
 ) -> float | str:
     """
     Read statistics from the file.
@@ -95,36 +168,71 @@ def _read_stats_file(
         report_mo (str): The reporting month.
         report_yr (str): The reporting year.
         disp (str): The display string for the statistics type.
+        cache (SourceCache | None, optional): Cache of values read from the file. Defaults to None.
 
     Returns:
         float | str: The statistics value or "Not Found" if an error occurs.
     """
     print(f" {disp} file found.\n Reading file...")
-    try:
-        return (
-            float(
-                acc_time.search_matching_value(
-                    header_srch_value=report_yr, row_srch_value=report_mo
-                )
-            )
-            * 100
-        )
-    except TypeError:
-        print(" Error reading.")
-        return "Not Found"
+    return cached_extract(
+        cache=cache,
+        source=acc_time,
+        key=f"stats {report_yr} {report_mo}",
+        extract=partial(_get_stats, report_mo=report_mo, report_yr=report_yr),
+    )
 
 
-def _read_jobs_file(copy_jobs: Xlsx) -> int | str:
+def _get_stats(acc_time: Xlsx, report_mo: str, report_yr: str) -> float | str:
+    """
+    Read the statistics value for the reporting month from the file.
+
+    Args:
+        acc_time (Xlsx): The Xlsx object containing statistics data.
+        report_mo (str): The reporting month.
+        report_yr (str): The reporting year.
+
+    Returns:
+        float | str: The statistics value or "Not Found" if an error occurs.
+    """
+    value = acc_time.search_matching_value(
+        header_srch_value=report_yr, row_srch_value=report_mo
+    )
+    if value is not False:
+        try:
+            return float(value) * 100
+        except ValueError:
+            pass
+    print(" Error reading.")
+    return "Not Found"
+
+
+def _read_jobs_file(copy_jobs: Xlsx, cache: SourceCache | None = None) -> int | str:
     """
     Read the total jobs from the file.
 
     Args:
         copy_jobs (Xlsx): The Xlsx object containing jobs data.
+        cache (SourceCache | None, optional): Cache of values read from the file. Defaults to None.
 
     Returns:
         int | str: The total number of jobs or "Not Found" if an error occurs.
     """
     print(" Total Jobs file found.\n Reading file...")
+    return cached_extract(
+        cache=cache, source=copy_jobs, key="total jobs", extract=_get_total_jobs
+    )
+
+
+def _get_total_jobs(copy_jobs: Xlsx) -> int | str:
+    """
+    Read the total jobs value from the file.
+
+    Args:
+        copy_jobs (Xlsx): The Xlsx object containing jobs data.
+
+    Returns:
+        int | str: The total number of jobs or "Not Found" if an error occurs.
+    """
     try:
         return int(
             copy_jobs.get_matching_value(
@@ -136,17 +244,22 @@ def _read_jobs_file(copy_jobs: Xlsx) -> int | str:
         return "Not Found"
 
 
-def _get_user_input(display: str, return_type: str) -> float | int:
+def _get_user_input(
+    display: str, return_type: str, answer: float | int | None = None
+) -> float | int:
     """
     Prompt the user to enter input.
 
     Args:
         display (str): The display string for the input type.
         return_type (str): The return type of the input ("f" for float, "i" for int).
+        answer (float | int | None, optional): Answer to return instead of prompting. Defaults to None.
 
     Returns:
         float | int: The user input.
     """
+    if answer is not None:
+        return float(answer) if return_type == "f" else int(answer)
     while True:
         user_input = input(f" Please enter monthly {display}: ")
         try:
@@ -156,7 +269,13 @@ def _get_user_input(display: str, return_type: str) -> float | int:
 
 
 def _get_production_stats(
-    accuracy: Xlsx, timeliness: Xlsx, copy_jobs: Xlsx, data: dict, today: date
+    accuracy: Xlsx,
+    timeliness: Xlsx,
+    copy_jobs: Xlsx,
+    data: dict,
+    today: date,
+    cache: SourceCache | None = None,
+    answers: dict | None = None,
 ) -> None:
     """
     Get production statistics.
@@ -167,7 +286,11 @@ def _get_production_stats(
         copy_jobs (Xlsx): The Xlsx object containing jobs data.
         data (dict): The dictionary to store production statistics.
         today (date): The current date.
+        cache (SourceCache | None, optional): Cache of values read from the files. Defaults to None.
+        answers (dict | None, optional): Answers with fallback totals to use instead of
+            prompting the user for missing files. Defaults to None.
     """
+    answers = answers or {}
     if any((accuracy, timeliness)):
         report_month, report_year = _get_reporting_month_year(today=today)
 
@@ -181,15 +304,22 @@ def _get_production_stats(
                 report_mo=report_month,
                 report_yr=report_year,
                 disp=key,
+                cache=cache,
             )
             if file
-            else _get_user_input(display=display, return_type=return_type)
+            else _get_user_input(
+                display=display, return_type=return_type, answer=answers.get(key)
+            )
         )
     try:
         data["Number of Jobs"] = (
-            _read_jobs_file(copy_jobs=copy_jobs)
+            _read_jobs_file(copy_jobs=copy_jobs, cache=cache)
             if copy_jobs
-            else _get_user_input(display="jobs total", return_type="i")
+            else _get_user_input(
+                display="jobs total",
+                return_type="i",
+                answer=answers.get("Number of Jobs"),
+            )
         )
     except TypeError:
         data["Number of Jobs"] = "Error"
@@ -203,6 +333,8 @@ def calculate_production_totals(
     data: dict,
     production_info: dict,
     today: date,
+    cache: SourceCache | None = None,
+    answers: dict | None = None,
 ) -> None:
     """
     Calculate production totals.
@@ -215,17 +347,22 @@ def calculate_production_totals(
         data (dict): The dictionary to store production totals.
         production_info (dict): The dictionary containing machine data.
         today (date): The current date.
+        cache (SourceCache | None, optional): Cache of values read from the files. Defaults to None.
+        answers (dict | None, optional): Answers to use instead of prompting the user. Defaults to None.
     """
     _read_production_volumes(
         meters=meters,
         data=data,
         production_info=production_info,
+        cache=cache,
     )
-    _get_waste_totals(data=data)
+    _get_waste_totals(data=data, answers=answers)
     _get_production_stats(
         accuracy=accuracy,
         timeliness=timeliness,
         copy_jobs=copy_jobs,
         data=data,
         today=today,
+        cache=cache,
+        answers=answers,
     )
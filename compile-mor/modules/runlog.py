@@ -0,0 +1,225 @@
+"""
+This module provides the structured run log: one JSON record per line (JSON Lines) with
+the run's timestamp, program version, source file hashes and totals. The log is rotated
+into gzip-compressed backups when it grows too large, and records can be streamed back
+(oldest first) with filters.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+
+def log_file_path(app_files: Path, log_format: str = "jsonl") -> Path:
+    """
+    Gets the path of the log file for a log format.
+
+    Args:
+        app_files (Path): The path to the application files.
+        log_format (str, optional): "jsonl" for the structured log, or "text" for the
+            plain text log. Defaults to "jsonl".
+
+    Returns:
+        Path: MOR_Log.jsonl or MOR_Log.txt in the application files folder.
+    """
+    name = "MOR_Log.jsonl" if log_format == "jsonl" else "MOR_Log.txt"
+    return Path(app_files) / name
+
+
+def hash_file(filepath: Path) -> str:
+    """
+    Generates the SHA-256 hash of a file, reading it in chunks.
+
+    Args:
+        filepath (Path): The path to the file.
+
+    Returns:
+        str: The hex digest of the file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _backup_path(log_file: Path, number: int) -> Path:
+    """
+    Gets the path of a rotated log backup. ex: MOR_Log.2.jsonl.gz
+
+    Args:
+        log_file (Path): The path to the log file.
+        number (int): The backup number (1 is the newest).
+
+    Returns:
+        Path: The path to the backup.
+    """
+    return log_file.with_name(f"{log_file.stem}.{number}{log_file.suffix}.gz")
+
+
+def rotate_log(log_file: Path, max_bytes: int, backups: int) -> bool:
+    """
+    Moves the log file into a gzip-compressed backup if it has reached max_bytes. Older
+    backups are renumbered and any beyond the number of backups kept are deleted.
+
+    Args:
+        log_file (Path): The path to the log file.
+        max_bytes (int): The size at which the log is rotated.
+        backups (int): The number of compressed backups to keep.
+
+    Returns:
+        bool: True if the log was rotated.
+    """
+    log_file = Path(log_file)
+    if not log_file.is_file() or log_file.stat().st_size < max_bytes:
+        return False
+
+    _backup_path(log_file, backups).unlink(missing_ok=True)
+    for number in range(backups - 1, 0, -1):
+        if _backup_path(log_file, number).is_file():
+            _backup_path(log_file, number).replace(_backup_path(log_file, number + 1))
+
+    if backups:
+        with open(log_file, "rb") as source, gzip.open(
+            _backup_path(log_file, 1), "wb"
+        ) as backup:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                backup.write(chunk)
+    log_file.unlink()
+    return True
+
+
+def write_log_record(
+    log_file: Path,
+    record_type: str,
+    fields: dict,
+    max_bytes: int = 1_000_000,
+    backups: int = 5,
+) -> dict:
+    """
+    Appends a record to the log file, rotating the log first if it's too large.
+
+    Args:
+        log_file (Path): The path to the log file.
+        record_type (str): The kind of record. ex: "totals", "trace"
+        fields (dict): The record's contents.
+        max_bytes (int, optional): The size at which the log is rotated. Defaults to 1,000,000.
+        backups (int, optional): The number of compressed backups to keep. Defaults to 5.
+
+    Returns:
+        dict: The record written.
+    """
+    rotate_log(log_file, max_bytes, backups)
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "type": record_type,
+        **fields,
+    }
+    with open(log_file, "a", encoding="utf-8") as file:
+        file.write(json.dumps(record, default=str) + "\n")
+    return record
+
+
+def log_totals(
+    log_file: Path,
+    data: dict,
+    formatted_date: str,
+    version: str,
+    sources: list[Path],
+    max_bytes: int = 1_000_000,
+    backups: int = 5,
+) -> dict:
+    """
+    Appends the totals of a run to the log file.
+
+    Args:
+        log_file (Path): The path to the log file.
+        data (dict): The compiled totals.
+        formatted_date (str): The date the totals were compiled.
+        version (str): The program version.
+        sources (list[Path]): The data source files the totals were read from.
+        max_bytes (int, optional): The size at which the log is rotated. Defaults to 1,000,000.
+        backups (int, optional): The number of compressed backups to keep. Defaults to 5.
+
+    Returns:
+        dict: The record written.
+    """
+    return write_log_record(
+        log_file,
+        "totals",
+        {
+            "date": formatted_date,
+            "version": version,
+            "sources": {
+                Path(source).name: hash_file(source)
+                for source in sources
+                if Path(source).is_file()
+            },
+            "totals": data,
+        },
+        max_bytes=max_bytes,
+        backups=backups,
+    )
+
+
+def read_log_records(
+    log_file: Path,
+    record_type: str | None = "totals",
+    since: str | None = None,
+    until: str | None = None,
+    metrics: list[str] | None = None,
+) -> Iterator[dict]:
+    """
+    Streams the records of the log file and its backups, oldest first, one line at a
+    time. Lines that aren't valid records are skipped.
+
+    Args:
+        log_file (Path): The path to the log file.
+        record_type (str | None, optional): Only yield records of this type, or every
+            record if None. Defaults to "totals".
+        since (str | None, optional): Only yield records with timestamps at or after
+            this ISO date/time. ex: "2024-01" Defaults to None.
+        until (str | None, optional): Only yield records with timestamps before this ISO
+            date/time. Defaults to None.
+        metrics (list[str] | None, optional): Only keep these totals in each record.
+            Defaults to None.
+
+    Yields:
+        dict: The matching records.
+    """
+    log_file = Path(log_file)
+    backups = sorted(
+        log_file.parent.glob(f"{log_file.stem}.*{log_file.suffix}.gz"),
+        key=lambda path: int(path.name[len(log_file.stem) + 1 :].split(".")[0]),
+        reverse=True,
+    )
+
+    for path in [*backups, log_file]:
+        if not path.is_file():
+            continue
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if record_type and record.get("type") != record_type:
+                    continue
+                timestamp = record.get("timestamp", "")
+                if (since and timestamp < since) or (until and timestamp >= until):
+                    continue
+                if metrics is not None and "totals" in record:
+                    record["totals"] = {
+                        metric: value
+                        for metric, value in record["totals"].items()
+                        if metric in metrics
+                    }
+                yield record
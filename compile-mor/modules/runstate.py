@@ -0,0 +1,125 @@
+"""
+This module provides the saved state of the previous run (the MOR totals of each
+calculation stage and fingerprints of the inputs each stage read), so an incremental run
+only recalculates the stages whose inputs changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from classes.dclasses import MOR
+from modules.sourcecache import get_fingerprint, json_values, write_json_file
+
+STAGES = {
+    "mps": "mps_data",
+    "production": "production_data",
+    "mail": "mail_data",
+    "fleet": "fleet_data",
+}
+"""Calculation stages and the MOR attributes holding their totals."""
+
+
+def input_fingerprints(sources: dict, settings: dict | None = None) -> dict:
+    """
+    Generates the fingerprints of a stage's inputs.
+
+    Args:
+        sources (dict): Input names and the paths to the files (or None if missing).
+        settings (dict | None, optional): Settings and answers the stage depends on.
+            Defaults to None.
+
+    Returns:
+        dict: Input names and their fingerprints ("missing" for missing files), plus a
+        hash of the settings.
+    """
+    fingerprints = {
+        name: get_fingerprint(path) if path and Path(path).is_file() else "missing"
+        for name, path in sources.items()
+    }
+    fingerprints["settings"] = hashlib.sha256(
+        json.dumps(settings, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return fingerprints
+
+
+class RunState:
+    """
+    JSON file of the previous run's totals by stage and the fingerprints of each
+    stage's inputs. The state only applies to the reporting month it was saved for.
+    """
+
+    def __init__(self, state_file: Path, month: str) -> None:
+        """
+        Loads the state file if it exists and was saved for the same reporting month.
+
+        Args:
+            state_file (Path): The path to the state file.
+            month (str): The reporting month as "YYYY-MM".
+        """
+        self.state_file = Path(state_file)
+        self.month = month
+        self.stages = {}
+
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return
+        if isinstance(state, dict) and state.get("month") == month:
+            self.stages = state.get("stages", {})
+
+    def is_current(self, stage: str, fingerprints: dict) -> bool:
+        """
+        Checks if a stage has saved totals for the same inputs.
+
+        Args:
+            stage (str): The stage name. ex: "production"
+            fingerprints (dict): The fingerprints of the stage's current inputs.
+
+        Returns:
+            bool: True if the saved totals can be reused.
+        """
+        saved = self.stages.get(stage)
+        return bool(saved) and saved["inputs"] == fingerprints
+
+    def restore(self, stage: str, mor: MOR) -> None:
+        """
+        Copies a stage's saved totals into the MOR object.
+
+        Args:
+            stage (str): The stage name.
+            mor (MOR): The MOR object to be updated.
+        """
+        getattr(mor, STAGES[stage]).update(self.stages[stage]["totals"])
+
+    def update(self, stage: str, fingerprints: dict, mor: MOR) -> dict:
+        """
+        Records a stage's totals and the fingerprints of the inputs they came from.
+
+        Args:
+            stage (str): The stage name.
+            fingerprints (dict): The fingerprints of the stage's inputs.
+            mor (MOR): The MOR object holding the stage's totals.
+
+        Returns:
+            dict: The stage's totals.
+        """
+        totals = getattr(mor, STAGES[stage])
+        self.stages[stage] = {"inputs": fingerprints, "totals": totals}
+        return totals
+
+    def save(self) -> None:
+        """
+        Writes the state file (see write_json_file). Totals that can't be written to JSON
+        are left out, so restore never copies a changed value back into the MOR object
+        and those stages are recalculated on the next run.
+        """
+        stages = {}
+        for stage, saved in self.stages.items():
+            totals = json_values(saved["totals"])
+            if len(totals) == len(saved["totals"]):
+                stages[stage] = {"inputs": saved["inputs"], "totals": totals}
+        write_json_file(self.state_file, {"month": self.month, "stages": stages})
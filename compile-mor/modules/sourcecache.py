@@ -0,0 +1,224 @@
+"""
+This module provides an on-disk cache of the values extracted from the data source files,
+so unchanged files don't have to be parsed again on the next run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from modules.loadfile import load_data_source_file
+
+if TYPE_CHECKING:
+    from classes.xlclass import Xlsx
+
+
+def get_fingerprint(filepath: Path) -> str:
+    """
+    Generates a fingerprint for a file from its location, size and modification time.
+
+    Args:
+        filepath (Path): The path to the file.
+
+    Returns:
+        str: The fingerprint of the file.
+    """
+    stats = Path(filepath).stat()
+    return f"{Path(filepath).resolve()}|{stats.st_size}|{stats.st_mtime_ns}"
+
+
+def json_values(values: dict) -> dict:
+    """
+    Filters out the values that can't be written to JSON (ex: datetimes), so they are
+    worked out again on the next run instead of being saved as something else.
+
+    Args:
+        values (dict): Keys and values to be saved.
+
+    Returns:
+        dict: The keys and values that can be written to JSON.
+    """
+    kept = {}
+    for key, value in values.items():
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        kept[key] = value
+    return kept
+
+
+def write_json_file(filepath: Path, data: object) -> None:
+    """
+    Writes data to a JSON file. The data is serialized first and written next to the
+    file, then swapped in once complete (keeping the file's permissions), so an error
+    never leaves the file truncated.
+
+    Args:
+        filepath (Path): The path to the JSON file.
+        data (object): The data to be written.
+    """
+    filepath = Path(filepath)
+    contents = json.dumps(data, indent=2)
+
+    handle, temp_path = tempfile.mkstemp(suffix=".json", dir=filepath.parent)
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            file.write(contents)
+        if filepath.exists():
+            shutil.copymode(filepath, temp_path)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@dataclass
+class CachedFile:
+    """
+    Stand-in for a data source file that has values in the cache. The file is only
+    loaded if a value that isn't cached is needed.
+
+    Attributes:
+        path (Path): The path to the file.
+        settings (dict): The load_data_source_file arguments used to load the file.
+        loaded (Xlsx | None): The Xlsx object once the file has been loaded.
+    """
+
+    path: Path
+    settings: dict
+    loaded: Xlsx | None = field(default=None, repr=False)
+
+    def load(self) -> Xlsx | None:
+        """
+        Loads the file (once).
+
+        Returns:
+            Xlsx | None: An Xlsx object for the file.
+        """
+        if not self.loaded:
+            self.loaded = load_data_source_file(**self.settings)
+        return self.loaded
+
+
+def cached_extract(
+    cache: SourceCache | None, source: Xlsx | CachedFile | Path, key: str, extract: Callable
+) -> any:
+    """
+    Extracts a value from a data source through the cache if there is one.
+
+    Args:
+        cache (SourceCache | None): The cache, or None to always extract.
+        source (Xlsx | CachedFile | Path): The data source (or the path to it).
+        key (str): A description of the value, including anything it depends on.
+        extract (Callable): Function taking the (loaded) source and returning the value.
+
+    Returns:
+        any: The cached or extracted value.
+    """
+    if cache:
+        return cache.get_or_extract(source, key, extract)
+    if isinstance(source, CachedFile):
+        source = source.load()
+    return extract(source)
+
+
+class SourceCache:
+    """
+    JSON file cache of values extracted from data source files, keyed by file
+    fingerprint and a description of the values read. Entries are evicted by age
+    and count when the cache is saved.
+    """
+
+    def __init__(
+        self, cache_file: Path, max_entries: int = 50, max_age_days: int = 90
+    ) -> None:
+        """
+        Loads the cache file if it exists.
+
+        Args:
+            cache_file (Path): The path to the cache file.
+            max_entries (int, optional): The number of file entries to keep. Defaults to 50.
+            max_age_days (int, optional): The age in days after which entries are removed. Defaults to 90.
+        """
+        self.cache_file = Path(cache_file)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.entries = {}
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            pass
+
+    def has(self, filepath: Path) -> bool:
+        """
+        Checks if there are cached values for the current version of a file.
+
+        Args:
+            filepath (Path): The path to the file.
+
+        Returns:
+            bool: True if the cache has values for the file.
+        """
+        return get_fingerprint(filepath) in self.entries
+
+    def get_or_extract(
+        self, source: Xlsx | CachedFile | Path, key: str, extract: Callable
+    ) -> any:
+        """
+        Returns a cached value for the source file, or extracts and caches it.
+
+        Args:
+            source (Xlsx | CachedFile | Path): The data source (or the path to it).
+            key (str): A description of the value, including anything it depends on.
+            extract (Callable): Function taking the (loaded) source and returning the value.
+
+        Returns:
+            any: The cached or extracted value.
+        """
+        filepath = source if isinstance(source, (str, Path)) else source.path
+        if not Path(filepath).is_file():
+            return extract(source)
+
+        fingerprint = get_fingerprint(filepath)
+        entry = self.entries.get(fingerprint)
+        if entry and key in entry["values"]:
+            entry["saved"] = time.time()
+            return entry["values"][key]
+
+        if isinstance(source, CachedFile):
+            source = source.load()
+        value = extract(source)
+
+        entry = self.entries.setdefault(fingerprint, {"values": {}})
+        entry["saved"] = time.time()
+        entry["values"][key] = value
+        return value
+
+    def save(self) -> None:
+        """
+        Removes old entries and writes the cache file. The file is written next to the
+        cache file and swapped in once complete, so an error never leaves it truncated.
+        """
+        cutoff = time.time() - self.max_age_days * 24 * 60 * 60
+        newest = sorted(
+            self.entries.items(), key=lambda item: item[1]["saved"], reverse=True
+        )
+        self.entries = {
+            fingerprint: entry
+            for fingerprint, entry in newest[: self.max_entries]
+            if entry["saved"] >= cutoff
+        }
+
+        for entry in self.entries.values():
+            entry["values"] = json_values(entry["values"])
+        write_json_file(self.cache_file, self.entries)
@@ -6,6 +6,9 @@ This module provides various utility functions used throughout the Compile-MOR p
 
 from .clearscreen import clear_screen  # Function to clear the screen
 from .dropfile import get_dropped_file  # Function to get the dropped file
+from .importtimer import time_imports, warm_imports  # Functions for heavy imports
 from .loadconfig import load_config  # Function to load configuration
+from .noprompt import prompts_disabled  # Context manager to disable prompts
 from .openfile import open_file  # Function to open a file
 from .pathchecker import check_paths  # Function to check paths
+from .stagetrace import traced_stage, tracing  # Stage timing instrumentation
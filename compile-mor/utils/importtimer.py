@@ -0,0 +1,68 @@
+"""
+This module provides utilities for the heavy third-party libraries the program imports
+on first use: warming them up in the background and timing their imports.
+"""
+
+__version__ = "1.0.0"
+
+import importlib
+import sys
+import threading
+import time
+
+HEAVY_MODULES = ("openpyxl", "pdfplumber", "pandas")
+"""Libraries that should only be imported on first use."""
+
+
+def _import_quietly(module_names: tuple) -> None:
+    """
+    Imports the modules, ignoring any that aren't installed.
+
+    Args:
+        module_names (tuple): Names of the modules to import.
+    """
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+
+def warm_imports(module_names: tuple = HEAVY_MODULES) -> threading.Thread:
+    """
+    Starts importing the modules on a background thread (while waiting on the user).
+
+    Args:
+        module_names (tuple, optional): Names of the modules to import. Defaults to HEAVY_MODULES.
+
+    Returns:
+        threading.Thread: The thread importing the modules.
+    """
+    thread = threading.Thread(target=_import_quietly, args=(module_names,), daemon=True)
+    thread.start()
+    return thread
+
+
+def time_imports(module_names: tuple = HEAVY_MODULES) -> dict:
+    """
+    Imports the modules one at a time and measures how long each one takes.
+
+    Args:
+        module_names (tuple, optional): Names of the modules to import. Defaults to HEAVY_MODULES.
+
+    Returns:
+        dict: A dictionary of module names and import times in seconds. Modules that were
+        already imported are None and modules that aren't installed are left out.
+    """
+    import_times = {}
+    for module_name in module_names:
+        if module_name in sys.modules:
+            import_times[module_name] = None
+            continue
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            continue
+        import_times[module_name] = time.perf_counter() - start
+    return import_times
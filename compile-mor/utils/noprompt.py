@@ -0,0 +1,32 @@
+"""
+This module provides a context manager that turns user prompts into errors, so runs
+without a user at the keyboard stop instead of waiting for input.
+"""
+
+__version__ = "1.0.0"
+
+import builtins
+from contextlib import contextmanager
+
+
+def _refuse_input(prompt: str = "") -> str:
+    """
+    Replacement for input() that ends the program with the prompt that needed an answer.
+
+    Args:
+        prompt (str, optional): The prompt that was going to be displayed.
+    """
+    exit(f"\n Input needed but prompts are disabled:\n {prompt.strip()}\n Exiting...")
+
+
+@contextmanager
+def prompts_disabled():
+    """
+    Disables input() while the context is active.
+    """
+    original_input = builtins.input
+    builtins.input = _refuse_input
+    try:
+        yield
+    finally:
+        builtins.input = original_input
@@ -0,0 +1,218 @@
+"""
+This module provides instrumentation for the stages of a run: wall time, CPU time, growth
+of the process's peak memory (RSS) and time spent waiting on input() are recorded for each
+stage, so slow I/O can be told apart from slow answers.
+"""
+
+__version__ = "1.0.0"
+
+import builtins
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+_ACTIVE_TRACE = None
+
+RSS_NOTES = {
+    "rss_growth_bytes": "How much the stage raised the process's peak RSS"
+    " (0 if it didn't set a new high).",
+    "process_peak_rss_bytes": "The peak RSS of the whole process when the stage"
+    " finished, not of the stage itself.",
+}
+"""Descriptions of the memory fields, written to the trace file."""
+
+
+def _process_peak_rss() -> int | None:
+    """
+    Gets the largest amount of memory the process has used so far. This is a high-water
+    mark for the whole process, so it never goes down between stages.
+
+    Returns:
+        int | None: The peak resident set size in bytes, or None if it can't be read.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class _MemoryCounters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = _MemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(
+                process, ctypes.byref(counters), counters.cb
+            ):
+                return None
+            return counters.PeakWorkingSetSize
+
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError, AttributeError):
+        return None
+
+
+class StageTrace:
+    """
+    Records the wall time, CPU time, input wait and peak RSS growth of each stage run
+    with stage(). CPU time is counted for the thread running the stage, so stages on
+    background threads are measured separately. Stages may be nested.
+    """
+
+    def __init__(self) -> None:
+        self.stages = []
+        self._input_wait = {}
+        self._lock = threading.Lock()
+
+    def _thread_input_wait(self) -> float:
+        """Returns the seconds the current thread has spent waiting on input()."""
+        return self._input_wait.get(threading.get_ident(), 0.0)
+
+    def add_input_wait(self, seconds: float) -> None:
+        """
+        Adds time spent waiting on input() to the current thread's stages.
+
+        Args:
+            seconds (float): The seconds spent waiting.
+        """
+        thread = threading.get_ident()
+        with self._lock:
+            self._input_wait[thread] = self._input_wait.get(thread, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Records the code run in the context as the named stage.
+
+        Args:
+            name (str): The name of the stage.
+        """
+        start_wait = self._thread_input_wait()
+        start_rss = _process_peak_rss()
+        start_cpu = time.thread_time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.thread_time() - start_cpu
+            input_wait = self._thread_input_wait() - start_wait
+            peak_rss = _process_peak_rss()
+            with self._lock:
+                self.stages.append(
+                    {
+                        "stage": name,
+                        "thread": threading.current_thread().name,
+                        "wall_seconds": round(wall, 6),
+                        "cpu_seconds": round(cpu, 6),
+                        "input_wait_seconds": round(input_wait, 6),
+                        "compute_seconds": round(wall - input_wait, 6),
+                        "rss_growth_bytes": (
+                            peak_rss - start_rss
+                            if None not in (peak_rss, start_rss)
+                            else None
+                        ),
+                        "process_peak_rss_bytes": peak_rss,
+                    }
+                )
+
+    def format(self) -> str:
+        """
+        Formats the recorded stages as a text table.
+
+        Returns:
+            str: One line per stage, in the order the stages finished.
+        """
+        lines = ["Stage timings:"]
+        for record in self.stages:
+            rss = record["rss_growth_bytes"]
+            lines.append(
+                f" {record['stage']:<42}"
+                f" wall {record['wall_seconds']:8.3f}s"
+                f" cpu {record['cpu_seconds']:8.3f}s"
+                f" input {record['input_wait_seconds']:8.3f}s"
+                + (f" rss growth {rss / 2**20:8.1f} MiB" if rss is not None else "")
+            )
+        return "\n".join(lines)
+
+    def save(self, trace_file: Path) -> None:
+        """
+        Writes the recorded stages to a JSON trace file.
+
+        Args:
+            trace_file (Path): The path to the trace file.
+        """
+        with open(trace_file, "w", encoding="utf-8") as file:
+            json.dump({"notes": RSS_NOTES, "stages": self.stages}, file, indent=2)
+
+
+@contextmanager
+def tracing(enabled: bool = True):
+    """
+    Activates a StageTrace for traced_stage() while the context is active, and counts
+    time spent waiting on input() as input wait instead of compute time.
+
+    Args:
+        enabled (bool, optional): If False, nothing is traced. Defaults to True.
+
+    Yields:
+        StageTrace | None: The active trace, or None if tracing is disabled.
+    """
+    global _ACTIVE_TRACE
+
+    if not enabled:
+        yield None
+        return
+
+    trace = StageTrace()
+    original_input = builtins.input
+
+    def timed_input(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_input(*args, **kwargs)
+        finally:
+            trace.add_input_wait(time.perf_counter() - start)
+
+    previous_trace, _ACTIVE_TRACE = _ACTIVE_TRACE, trace
+    builtins.input = timed_input
+    try:
+        yield trace
+    finally:
+        builtins.input = original_input
+        _ACTIVE_TRACE = previous_trace
+
+
+@contextmanager
+def traced_stage(name: str):
+    """
+    Records the code run in the context as a stage of the active trace. Does nothing
+    if tracing isn't active.
+
+    Args:
+        name (str): The name of the stage.
+    """
+    trace = _ACTIVE_TRACE
+    if trace is None:
+        yield
+        return
+    with trace.stage(name):
+        yield